@@ -15,6 +15,7 @@ const {
   stableJson,
 } = require('./interface-extractors/core');
 const {parseJavapCollection, splitParameters} = require('./interface-extractors/java');
+const {ensurePythonEnvironment} = require('./python-environment');
 
 const ROOT = path.resolve(__dirname, '..');
 const MAX_BUFFER = 100 * 1024 * 1024;
@@ -23,15 +24,17 @@ function parseArguments(argv) {
   const result = {
     config: path.join(ROOT, 'scripts/interface-extractor.config.json'),
     keepTemp: false,
+    profile: false,
   };
   for (let index = 0; index < argv.length; index += 1) {
     const argument = argv[index];
     if (argument === '--keep-temp') result.keepTemp = true;
+    else if (argument === '--profile') result.profile = true;
     else if (['--config', '--sdk-root', '--output'].includes(argument)) {
       if (!argv[index + 1]) throw new Error(`${argument} requires a value`);
       result[argument.slice(2).replace(/-([a-z])/g, (_, letter) => letter.toUpperCase())] = argv[++index];
     } else if (argument === '--help') {
-      process.stdout.write('Usage: node scripts/extract-v3-interfaces.js [--config FILE] [--sdk-root DIR] [--output DIR] [--keep-temp]\n');
+      process.stdout.write('Usage: node scripts/extract-v3-interfaces.js [--config FILE] [--sdk-root DIR] [--output DIR] [--keep-temp] [--profile]\n');
       process.exit(0);
     } else throw new Error(`Unknown argument: ${argument}`);
   }
@@ -77,14 +80,11 @@ function runJson(executable, args, options) {
   }
 }
 
-function extractPython(snapshot) {
-  const venv = path.join(snapshot, '.interface-extractor-venv');
-  command('python3', ['-m', 'venv', venv], {quiet: true});
-  const python = path.join(venv, 'bin', 'python');
-  // Both refs can declare the same package version. Disabling pip's wheel cache
-  // prevents a wheel built from one committed ref from being reused for the other.
-  command(python, ['-m', 'pip', 'install', '--disable-pip-version-check', '--no-cache-dir', snapshot], {quiet: true});
-  return runJson(python, [path.join(ROOT, 'scripts/interface-extractors/extract-python.py')], {cwd: snapshot});
+function extractPython(snapshot, profilePath) {
+  const python = ensurePythonEnvironment([], {source: snapshot, label: path.basename(snapshot), quiet: true});
+  const args = [path.join(ROOT, 'scripts/interface-extractors/extract-python.py')];
+  if (profilePath) args.push('--profile', profilePath);
+  return runJson(python, args, {cwd: snapshot});
 }
 
 function extractTypeScript(snapshot) {
@@ -169,8 +169,8 @@ function attachJavaDocumentation(symbol, javadocRoot) {
   }
 }
 
-function extractLanguage(language, snapshot) {
-  if (language === 'python') return extractPython(snapshot);
+function extractLanguage(language, snapshot, profilePath) {
+  if (language === 'python') return extractPython(snapshot, profilePath);
   if (language === 'typescript') return extractTypeScript(snapshot);
   if (language === 'java') return extractJava(snapshot);
   throw new Error(`Unsupported language in extractor configuration: ${language}`);
@@ -192,6 +192,7 @@ function main() {
   const refs = {};
   const baseManifests = {};
   const candidateManifests = {};
+  const profiles = {};
 
   try {
     requireCommands(['git', 'tar', 'python3', 'npm', 'java', 'jar']);
@@ -221,8 +222,17 @@ function main() {
       const candidateSnapshot = path.join(tempRoot, `${language}-candidate`);
       archiveRef(repository, baseCommit, baseSnapshot, tempRoot);
       archiveRef(repository, candidateCommit, candidateSnapshot, tempRoot);
-      const baseExtracted = extractLanguage(language, baseSnapshot);
-      const candidateExtracted = extractLanguage(language, candidateSnapshot);
+      // Only the Python extractor supports --profile; its reports are written
+      // next to the manifests as python-base-profile.json and python-v3-profile.json.
+      const profiling = options.profile && language === 'python';
+      const baseProfile = profiling ? path.join(tempRoot, `${language}-base-profile.json`) : undefined;
+      const candidateProfile = profiling ? path.join(tempRoot, `${language}-v3-profile.json`) : undefined;
+      const baseExtracted = extractLanguage(language, baseSnapshot, baseProfile);
+      const candidateExtracted = extractLanguage(language, candidateSnapshot, candidateProfile);
+      if (profiling) {
+        profiles[path.basename(baseProfile)] = baseProfile;
+        profiles[path.basename(candidateProfile)] = candidateProfile;
+      }
       if (baseExtracted.allModuleSymbols && candidateExtracted.allModuleSymbols) {
         const baseRootIds = new Set(baseExtracted.symbols.map((symbol) => symbol.id));
         const baseAllByName = new Map();
@@ -265,6 +275,7 @@ function main() {
       for (const [language, manifest] of Object.entries(candidateManifests)) {
         fs.writeFileSync(path.join(staging, `${language}-v3.json`), stableJson(manifest));
       }
+      for (const [name, profile] of Object.entries(profiles)) fs.copyFileSync(profile, path.join(staging, name));
       fs.writeFileSync(path.join(staging, 'v3-interface-diff.json'), stableJson(diff));
       fs.writeFileSync(path.join(staging, 'v3-interface-diff.md'), renderDiffMarkdown(diff));
       fs.writeFileSync(path.join(staging, 'v3-interface-summary.md'), renderSummaryMarkdown(diff));
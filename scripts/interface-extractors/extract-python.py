@@ -3,14 +3,130 @@
 
 from __future__ import annotations
 
+import argparse
+import contextlib
 import enum
 import importlib
+import importlib.abc
 import inspect
 import json
 import pkgutil
+import platform
 import re
 import sys
-from typing import Any
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Iterator
+
+
+class Profile:
+    """Wall time and tracemalloc allocation peaks recorded by --profile.
+
+    Measurements nest: a module imported while another module or a symbol is
+    measured is recorded on its own, and its time is excluded from the outer
+    record's ``selfSeconds``. Timings include tracemalloc's own overhead;
+    compare profiles with each other rather than with unprofiled runs.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.records: dict[str, list[dict[str, Any]]] = {"import": [], "introspection": [], "serialization": []}
+        # One entry per open measurement: the highest absolute peak seen by
+        # measurements nested in it, and the seconds they took.
+        self.open: list[dict[str, float]] = []
+
+    @contextlib.contextmanager
+    def measure(self, phase: str, name: str) -> Iterator[None]:
+        # reset_peak() discards the peak of an enclosing measurement, so carry
+        # it on the stack and fold it back in when this measurement ends.
+        if self.open:
+            self.open[-1]["peak"] = max(self.open[-1]["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        self.open.append({"peak": 0, "nestedSeconds": 0.0})
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            nested = self.open.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], nested["peak"])
+            if self.open:
+                self.open[-1]["peak"] = max(self.open[-1]["peak"], peak)
+                self.open[-1]["nestedSeconds"] += seconds
+            self.records[phase].append({
+                "name": name,
+                "seconds": seconds,
+                "selfSeconds": max(seconds - nested["nestedSeconds"], 0.0),
+                "peakBytes": max(peak - baseline, 0),
+            })
+
+    def report(self) -> dict[str, Any]:
+        def ranked(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return sorted(records, key=lambda record: (-record["selfSeconds"], record["name"]))
+
+        return {
+            "python": platform.python_version(),
+            "totalSeconds": time.perf_counter() - self.started,
+            "phases": {
+                phase: {
+                    "count": len(records),
+                    "seconds": sum(record["selfSeconds"] for record in records),
+                    "peakBytes": max((record["peakBytes"] for record in records), default=0),
+                }
+                for phase, records in self.records.items()
+            },
+            "modules": ranked(self.records["import"]),
+            "symbols": ranked(self.records["introspection"]),
+        }
+
+
+PROFILE: Profile | None = None
+
+
+class _TimedLoader:
+    """Delegate to a module's loader, measuring the execution of the module."""
+
+    def __init__(self, loader: Any, profile: Profile) -> None:
+        self._loader = loader
+        self._profile = profile
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        with self._profile.measure("import", module.__name__):
+            self._loader.exec_module(module)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """Record every module import, including imports made by other modules.
+
+    ``import pdfdancer`` imports the SDK's submodules and dependencies; each is
+    measured separately so the profile shows which of them are slow.
+    """
+
+    def __init__(self, profile: Profile) -> None:
+        self.profile = profile
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.profile)
+                return spec
+        return None
+
+
+def measured(phase: str, name: str) -> contextlib.AbstractContextManager[None]:
+    return contextlib.nullcontext() if PROFILE is None else PROFILE.measure(phase, name)
 
 
 def clean(value: str) -> str:
@@ -18,11 +134,15 @@ def clean(value: str) -> str:
     return re.sub(r"\s+", " ", value).strip()
 
 
-def signature(value: Any, name: str) -> str:
+def parameters(value: Any) -> str:
     try:
-        return f"{name}{clean(str(inspect.signature(value)))}"
+        return clean(str(inspect.signature(value)))
     except (TypeError, ValueError):
-        return name
+        return ""
+
+
+def signature(value: Any, name: str) -> str:
+    return f"{name}{parameters(value)}"
 
 
 def arity(value: Any) -> int | None:
@@ -73,7 +193,7 @@ def member(owner: type[Any], name: str, value: Any) -> dict[str, Any] | None:
     return None
 
 
-def class_symbol(export_name: str, value: type[Any]) -> dict[str, Any]:
+def class_symbol(value: type[Any]) -> dict[str, Any]:
     kind = "enum" if issubclass(value, enum.Enum) else "class"
     members: list[dict[str, Any]] = []
     if kind == "enum":
@@ -99,35 +219,58 @@ def class_symbol(export_name: str, value: type[Any]) -> dict[str, Any]:
         if extracted is not None:
             members.append(extracted)
 
-    result = {
-        "id": export_name,
-        "name": export_name,
+    return {
         "module": value.__module__.removeprefix("pdfdancer."),
         "kind": kind,
-        "signature": signature(value, export_name),
+        "parameters": parameters(value),
         "members": members,
+        "description": description(value),
     }
-    documentation = description(value)
-    if documentation:
-        result["description"] = documentation
-    return result
+
+
+def routine_symbol(value: Any) -> dict[str, Any]:
+    return {
+        "module": getattr(value, "__module__", "").removeprefix("pdfdancer."),
+        "kind": "function",
+        "parameters": parameters(value),
+        "members": [],
+        "description": description(value),
+    }
+
+
+# Both extraction views reach the same classes and functions; each one is
+# introspected once and the views only differ in the name they export it as.
+SYMBOL_TABLE: dict[tuple[str, str], tuple[Any, dict[str, Any]]] = {}
+
+
+def introspect(value: Any) -> dict[str, Any]:
+    build = class_symbol if inspect.isclass(value) else routine_symbol
+    qualname = getattr(value, "__qualname__", None)
+    if not isinstance(qualname, str):
+        return build(value)
+    key = (str(getattr(value, "__module__", "")), qualname)
+    cached = SYMBOL_TABLE.get(key)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    with measured("introspection", f"{key[0]}:{key[1]}"):
+        symbol = build(value)
+    SYMBOL_TABLE[key] = (value, symbol)
+    return symbol
 
 
 def exported_symbol(export_name: str, value: Any) -> dict[str, Any]:
-    if inspect.isclass(value):
-        return class_symbol(export_name, value)
-    if inspect.isroutine(value):
+    if inspect.isclass(value) or inspect.isroutine(value):
+        symbol = introspect(value)
         result = {
             "id": export_name,
             "name": export_name,
-            "module": getattr(value, "__module__", "").removeprefix("pdfdancer."),
-            "kind": "function",
-            "signature": signature(value, export_name),
-            "members": [],
+            "module": symbol["module"],
+            "kind": symbol["kind"],
+            "signature": f"{export_name}{symbol['parameters']}",
+            "members": symbol["members"],
         }
-        documentation = description(value)
-        if documentation:
-            result["description"] = documentation
+        if symbol["description"]:
+            result["description"] = symbol["description"]
         return result
     return {
         "id": export_name,
@@ -142,10 +285,10 @@ def exported_symbol(export_name: str, value: Any) -> dict[str, Any]:
 def all_module_symbols(package: Any) -> list[dict[str, Any]]:
     symbols: list[dict[str, Any]] = []
     modules = [package]
-    modules.extend(
-        importlib.import_module(module_info.name)
-        for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}.")
-    )
+    # walk_packages imports each package before descending into it, so import
+    # every module as soon as it is yielded; ImportTimer measures the imports.
+    for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+        modules.append(importlib.import_module(module_info.name))
     for module in modules:
         for name, value in sorted(vars(module).items()):
             if name.startswith("_") or getattr(value, "__module__", None) != module.__name__:
@@ -163,7 +306,7 @@ def all_module_symbols(package: Any) -> list[dict[str, Any]]:
 
 
 def extract() -> dict[str, Any]:
-    import pdfdancer
+    pdfdancer = importlib.import_module("pdfdancer")
 
     exports = getattr(pdfdancer, "__all__", None)
     if exports is None:
@@ -176,6 +319,30 @@ def extract() -> dict[str, Any]:
     return {"symbols": symbols, "allModuleSymbols": all_module_symbols(pdfdancer)}
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        type=Path,
+        help="write per-module import, per-symbol introspection, and serialization costs to FILE as JSON",
+    )
+    arguments = parser.parse_args()
+
+    global PROFILE
+    if arguments.profile is not None:
+        tracemalloc.start()
+        PROFILE = Profile()
+        sys.meta_path.insert(0, ImportTimer(PROFILE))
+
+    manifest = extract()
+    with measured("serialization", "json"):
+        json.dump(manifest, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+
+    if PROFILE is not None:
+        arguments.profile.write_text(json.dumps(PROFILE.report(), indent=2, sort_keys=True) + "\n")
+
+
 if __name__ == "__main__":
-    json.dump(extract(), sys.stdout, indent=2, sort_keys=True)
-    sys.stdout.write("\n")
+    main()
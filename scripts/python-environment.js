@@ -0,0 +1,255 @@
+'use strict';
+
+// Content-addressed cache of Python virtual environments.
+//
+// An environment is keyed by a hash of everything that determines its
+// contents: the base interpreter, the requirement set and, for local source
+// installs, the files of the source tree. A ready environment is reused without
+// running pip at all. A missing environment is built in place while holding
+// <key>.lock, so its console scripts and activate files point at their final
+// location. The manifest is written last and marks the environment ready: a
+// directory without one is a failed or interrupted build and is rebuilt.
+// Environments are evicted least recently used first once the cache exceeds its
+// disk budget, using the size recorded in each manifest.
+//
+// Environment variables:
+//   PDFDANCER_PYTHON_CACHE            cache directory (default node_modules/.cache/pdfdancer-python)
+//   PDFDANCER_PYTHON_CACHE_BUDGET_MB  disk budget in MiB (default 2048)
+//   PDFDANCER_PYTHON_WHEELHOUSE       install offline from this directory of wheels
+//   PYTHON                            base interpreter (default python3, or python on Windows)
+
+const childProcess = require('node:child_process');
+const crypto = require('node:crypto');
+const fs = require('node:fs');
+const path = require('node:path');
+
+const ROOT = path.resolve(__dirname, '..');
+const MANIFEST = 'environment.json';
+const DEFAULT_BUDGET_MB = 2048;
+const LOCK_POLL_MS = 500;
+const STALE_LOCK_MS = 60 * 60 * 1000;
+const IGNORED_SOURCE_ENTRIES = new Set(['.git', '__pycache__', 'node_modules', '.venv', 'build', 'dist']);
+
+function cacheRoot() {
+  return path.resolve(ROOT, process.env.PDFDANCER_PYTHON_CACHE || 'node_modules/.cache/pdfdancer-python');
+}
+
+function baseInterpreter() {
+  return process.env.PYTHON || (process.platform === 'win32' ? 'python' : 'python3');
+}
+
+function environmentPython(directory) {
+  return process.platform === 'win32'
+    ? path.join(directory, 'Scripts', 'python.exe')
+    : path.join(directory, 'bin', 'python');
+}
+
+function run(commandName, args, options = {}) {
+  const result = childProcess.spawnSync(commandName, args, {
+    cwd: ROOT,
+    env: process.env,
+    encoding: 'utf8',
+    stdio: options.quiet ? ['ignore', 'pipe', 'pipe'] : 'inherit',
+  });
+  if (result.error) throw result.error;
+  if (result.status !== 0) {
+    const details = [result.stdout, result.stderr].filter(Boolean).join('\n').trim();
+    throw new Error(`Command failed: ${commandName} ${args.join(' ')}${details ? `\n${details}` : ''}`);
+  }
+  return (result.stdout || '').trim();
+}
+
+function interpreterIdentity(python) {
+  return run(python, ['-c', 'import sys, sysconfig; print(sys.version); print(sysconfig.get_platform())'], {quiet: true});
+}
+
+function sourceTreeDigest(directory) {
+  const hash = crypto.createHash('sha256');
+  const visit = (relative) => {
+    const entries = fs.readdirSync(path.join(directory, relative), {withFileTypes: true})
+      .filter((entry) => !IGNORED_SOURCE_ENTRIES.has(entry.name) && !entry.name.endsWith('.egg-info'))
+      .sort((left, right) => (left.name < right.name ? -1 : left.name > right.name ? 1 : 0));
+    for (const entry of entries) {
+      const child = path.posix.join(relative, entry.name);
+      if (entry.isDirectory()) {
+        visit(child);
+      } else if (entry.isFile()) {
+        hash.update(`${child}\0`);
+        hash.update(fs.readFileSync(path.join(directory, child)));
+        hash.update('\0');
+      }
+    }
+  };
+  visit('');
+  return hash.digest('hex');
+}
+
+function environmentKey({interpreter, requirements = [], sources = []}) {
+  const description = {
+    interpreter,
+    requirements: [...requirements].sort(),
+    sources: [...sources].sort(),
+  };
+  return crypto.createHash('sha256').update(JSON.stringify(description)).digest('hex').slice(0, 32);
+}
+
+function directorySize(directory) {
+  let total = 0;
+  for (const entry of fs.readdirSync(directory, {withFileTypes: true})) {
+    const child = path.join(directory, entry.name);
+    if (entry.isDirectory()) total += directorySize(child);
+    else if (entry.isFile()) total += fs.statSync(child).size;
+  }
+  return total;
+}
+
+function readyEnvironments(root) {
+  if (!fs.existsSync(root)) return [];
+  return fs.readdirSync(root, {withFileTypes: true})
+    .filter((entry) => entry.isDirectory() && !entry.name.startsWith('.'))
+    .map((entry) => path.join(root, entry.name))
+    .filter((directory) => fs.existsSync(path.join(directory, MANIFEST)));
+}
+
+function recordedSize(directory) {
+  const {size} = JSON.parse(fs.readFileSync(path.join(directory, MANIFEST), 'utf8'));
+  return Number.isFinite(size) ? size : directorySize(directory);
+}
+
+function touch(directory) {
+  const now = new Date();
+  fs.utimesSync(path.join(directory, MANIFEST), now, now);
+}
+
+function evictEnvironments(root, budgetBytes, keep = []) {
+  const environments = readyEnvironments(root)
+    .map((directory) => ({
+      directory,
+      lastUsed: fs.statSync(path.join(directory, MANIFEST)).mtimeMs,
+      size: recordedSize(directory),
+    }))
+    .sort((left, right) => left.lastUsed - right.lastUsed);
+  let total = environments.reduce((sum, environment) => sum + environment.size, 0);
+  const evicted = [];
+  for (const environment of environments) {
+    if (total <= budgetBytes) break;
+    if (keep.includes(environment.directory)) continue;
+    fs.rmSync(environment.directory, {recursive: true, force: true});
+    total -= environment.size;
+    evicted.push(environment.directory);
+  }
+  return evicted;
+}
+
+function sleep(milliseconds) {
+  Atomics.wait(new Int32Array(new SharedArrayBuffer(4)), 0, 0, milliseconds);
+}
+
+function lockIsStale(lockPath) {
+  let stat;
+  let owner;
+  try {
+    stat = fs.statSync(lockPath);
+    owner = Number(fs.readFileSync(lockPath, 'utf8'));
+  } catch (error) {
+    if (error.code === 'ENOENT') return false;
+    throw error;
+  }
+  if (Date.now() - stat.mtimeMs > STALE_LOCK_MS) return true;
+  try {
+    process.kill(owner, 0);
+    return false;
+  } catch (error) {
+    return error.code === 'ESRCH';
+  }
+}
+
+// Takes <key>.lock, waiting while another process holds it. Returns false when
+// that process finished the environment in the meantime.
+function acquireLock(lockPath, directory) {
+  for (;;) {
+    try {
+      fs.writeFileSync(lockPath, String(process.pid), {flag: 'wx'});
+      return true;
+    } catch (error) {
+      if (error.code !== 'EEXIST') throw error;
+    }
+    if (fs.existsSync(path.join(directory, MANIFEST))) return false;
+    if (lockIsStale(lockPath)) fs.rmSync(lockPath, {force: true});
+    else sleep(LOCK_POLL_MS);
+  }
+}
+
+function installArguments(requirements, options) {
+  const args = ['-m', 'pip', 'install', '--disable-pip-version-check'];
+  const wheelhouse = process.env.PDFDANCER_PYTHON_WHEELHOUSE;
+  if (wheelhouse) args.push('--no-index', '--find-links', path.resolve(ROOT, wheelhouse));
+  // A wheel built from one source tree must not be reused for another tree
+  // that declares the same package version.
+  if (options.source) args.push('--no-cache-dir');
+  return [...args, ...requirements, ...(options.source ? [options.source] : [])];
+}
+
+function build(root, key, requirements, options) {
+  const directory = path.join(root, key);
+  const lockPath = path.join(root, `${key}.lock`);
+  if (!acquireLock(lockPath, directory)) return;
+  try {
+    if (fs.existsSync(path.join(directory, MANIFEST))) return;
+    fs.rmSync(directory, {recursive: true, force: true});
+    run(baseInterpreter(), ['-m', 'venv', directory], {quiet: options.quiet});
+    run(environmentPython(directory), installArguments(requirements, options), {quiet: options.quiet});
+    const manifest = {
+      label: options.label,
+      requirements,
+      source: options.source ? options.sourceDigest : undefined,
+      created: new Date().toISOString(),
+      size: directorySize(directory),
+    };
+    // Written last and renamed into place: the manifest marks the environment ready.
+    fs.writeFileSync(path.join(directory, `${MANIFEST}.tmp`), `${JSON.stringify(manifest, null, 2)}\n`);
+    fs.renameSync(path.join(directory, `${MANIFEST}.tmp`), path.join(directory, MANIFEST));
+  } catch (error) {
+    fs.rmSync(directory, {recursive: true, force: true});
+    throw error;
+  } finally {
+    fs.rmSync(lockPath, {force: true});
+  }
+}
+
+// Returns the interpreter of a ready environment for `requirements`, plus the
+// local `source` tree when given. The environment is built when missing.
+function ensurePythonEnvironment(requirements, options = {}) {
+  const root = cacheRoot();
+  fs.mkdirSync(root, {recursive: true});
+  const sourceDigest = options.source ? sourceTreeDigest(options.source) : undefined;
+  const key = environmentKey({
+    interpreter: interpreterIdentity(baseInterpreter()),
+    requirements,
+    sources: sourceDigest ? [sourceDigest] : [],
+  });
+  const directory = path.join(root, key);
+  const label = options.label || key;
+  const log = options.quiet ? () => {} : (message) => console.log(message);
+
+  if (fs.existsSync(path.join(directory, MANIFEST))) {
+    log(`Reusing Python environment ${key.slice(0, 12)} for ${label}`);
+  } else {
+    log(`Creating Python environment ${key.slice(0, 12)} for ${label}: ${requirements.join(' ') || options.source}`);
+    build(root, key, requirements, {...options, label, sourceDigest});
+  }
+  touch(directory);
+
+  const budgetMb = Number(process.env.PDFDANCER_PYTHON_CACHE_BUDGET_MB || DEFAULT_BUDGET_MB);
+  for (const evicted of evictEnvironments(root, budgetMb * 1024 * 1024, [directory])) {
+    log(`Evicted Python environment ${path.basename(evicted).slice(0, 12)}`);
+  }
+  return environmentPython(directory);
+}
+
+module.exports = {
+  ensurePythonEnvironment,
+  environmentKey,
+  evictEnvironments,
+  sourceTreeDigest,
+};
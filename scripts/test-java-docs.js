@@ -14,6 +14,10 @@ const DOCS_DIR = process.env.PDFDANCER_DOCS_DIR
   : path.join(REPO_ROOT, 'docs');
 const TEMP_DIR = path.join(REPO_ROOT, 'tests', '.java-temp');
 const MAVEN_PLUGIN_VERSION = '3.7.0';
+// Set by tests/doc_pipeline.py: read blocks from java.jsonl instead of scanning
+// the pages, and report per-block results in java-results.json.
+const BLOCKS_DIR = process.env.PDFDANCER_DOCS_BLOCKS;
+const IGNORE_MARKER = /<!--\s*docs-test:\s*ignore\s*-->\s*$/;
 
 function commandAvailable(command, args) {
   try {
@@ -57,6 +61,7 @@ function extractJavaBlocks(markdownPath) {
   const regex = /```java[ \t]*\r?\n([\s\S]*?)```/g;
   let match;
   while ((match = regex.exec(content)) !== null) {
+    if (IGNORE_MARKER.test(content.slice(0, match.index))) continue;
     blocks.push({
       code: match[1],
       line: content.slice(0, match.index).split(/\r?\n/).length,
@@ -65,6 +70,23 @@ function extractJavaBlocks(markdownPath) {
   return blocks;
 }
 
+function readQueue(queuePath) {
+  return fs.readFileSync(queuePath, 'utf8').split('\n').filter((line) => line.trim()).map((line) => JSON.parse(line));
+}
+
+function documentationBlocks() {
+  if (BLOCKS_DIR) {
+    const queued = readQueue(path.join(BLOCKS_DIR, 'java.jsonl'));
+    const pages = new Map();
+    for (const block of queued) {
+      const markdownPath = path.join(REPO_ROOT, block.filename);
+      pages.set(markdownPath, [...(pages.get(markdownPath) || []), {code: block.code, line: block.line}]);
+    }
+    return pages;
+  }
+  return new Map(markdownFiles(DOCS_DIR).map((markdownPath) => [markdownPath, extractJavaBlocks(markdownPath)]));
+}
+
 function extractTitledBlock(markdownPath, language, title) {
   const content = fs.readFileSync(markdownPath, 'utf8');
   const escapedLanguage = language.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
@@ -234,12 +256,12 @@ function main() {
   let hasErrors = false;
   let totalBlocks = 0;
   let fileNumber = 0;
+  const results = [];
 
   try {
     validateGettingStartedMavenProject();
     const dependenciesDir = resolveMavenDependencies(javaSdk);
-    for (const markdownPath of markdownFiles(DOCS_DIR)) {
-      const blocks = extractJavaBlocks(markdownPath);
+    for (const [markdownPath, blocks] of documentationBlocks()) {
       if (blocks.length === 0) continue;
       console.log(`Checking: ${path.relative(REPO_ROOT, markdownPath)}`);
 
@@ -253,6 +275,12 @@ function main() {
         const javaFile = path.join(TEMP_DIR, `${className}.java`);
         fs.writeFileSync(javaFile, code);
         const output = compileExample(javaFile, dependenciesDir);
+        results.push({
+          filename: path.relative(REPO_ROOT, markdownPath),
+          line: block.line,
+          ok: !output,
+          errors: output ? output.split(/\r?\n/).filter((line) => /error:/.test(line)) : [],
+        });
 
         if (output) {
           console.error(`  Block ${index + 1} (line ${block.line}): ERROR`);
@@ -266,6 +294,7 @@ function main() {
     }
   } finally {
     cleanupTempDir();
+    if (BLOCKS_DIR) fs.writeFileSync(path.join(BLOCKS_DIR, 'java-results.json'), `${JSON.stringify(results, null, 2)}\n`);
   }
 
   console.log(`\nTotal: ${totalBlocks} code blocks checked`);
@@ -1,9 +1,9 @@
 #!/usr/bin/env node
 'use strict';
 
-const fs = require('node:fs');
 const path = require('node:path');
 const {spawnSync} = require('node:child_process');
+const {ensurePythonEnvironment} = require('./python-environment');
 const {readSdkMetadata} = require('./sdk-metadata');
 
 const repoRoot = path.resolve(__dirname, '..');
@@ -13,12 +13,6 @@ const metadataPath = path.join(docsDir, 'sdk-versions.md');
 const metadata = readSdkMetadata(metadataPath);
 const pythonVersion = metadata.python.version;
 const environmentName = isV1 ? 'v1' : 'v3';
-const cacheRoot = path.join(repoRoot, 'node_modules', '.cache', 'pdfdancer-python-tests');
-const environmentDir = path.join(cacheRoot, environmentName);
-const pythonCommand = process.env.PYTHON || (process.platform === 'win32' ? 'python' : 'python3');
-const venvPython = process.platform === 'win32'
-  ? path.join(environmentDir, 'Scripts', 'python.exe')
-  : path.join(environmentDir, 'bin', 'python');
 
 function run(command, args) {
   const result = spawnSync(command, args, {cwd: repoRoot, stdio: 'inherit', env: process.env});
@@ -26,18 +20,12 @@ function run(command, args) {
   if (result.status !== 0) process.exit(result.status ?? 1);
 }
 
-fs.mkdirSync(cacheRoot, {recursive: true});
-if (!fs.existsSync(venvPython)) {
-  console.log(`Creating isolated Python environment: ${environmentName}`);
-  run(pythonCommand, ['-m', 'venv', environmentDir]);
+let venvPython;
+try {
+  venvPython = ensurePythonEnvironment(['pytest', `pdfdancer-client-python==${pythonVersion}`], {label: environmentName});
+} catch (error) {
+  console.error(error.message);
+  process.exit(1);
 }
 
-console.log(`Installing Python test dependencies for ${environmentName}: pdfdancer-client-python==${pythonVersion}`);
-run(venvPython, [
-  '-m', 'pip', 'install',
-  'mktestdocs',
-  'pytest',
-  `pdfdancer-client-python==${pythonVersion}`,
-]);
-
-run(venvPython, ['-m', 'pytest', 'tests', '-v']);
+run(venvPython, ['-m', 'pytest', 'tests', '-v', ...process.argv.slice(2)]);
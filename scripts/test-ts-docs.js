@@ -12,6 +12,10 @@ const IS_V1 = DOCS_DIR.split(path.sep).includes('versioned_docs');
 const METADATA = readSdkMetadata(path.join(DOCS_DIR, 'sdk-versions.md'));
 const SDK_VERSION = METADATA.typescript.version;
 const TEMP_DIR = path.join(REPO_ROOT, 'tests', '.ts-temp');
+// Set by tests/doc_pipeline.py: read blocks from typescript.jsonl instead of
+// scanning the pages, and report per-block results in typescript-results.json.
+const BLOCKS_DIR = process.env.PDFDANCER_DOCS_BLOCKS;
+const IGNORE_MARKER = /<!--\s*docs-test:\s*ignore\s*-->\s*$/;
 const NPM_ENV_DIR = path.join(
   REPO_ROOT,
   'node_modules',
@@ -58,10 +62,44 @@ function extractTsBlocks(markdownPath) {
   const blocks = [];
   const regex = /```typescript[ \t]*\r?\n([\s\S]*?)```/g;
   let match;
-  while ((match = regex.exec(content)) !== null) blocks.push(match[1]);
+  while ((match = regex.exec(content)) !== null) {
+    if (!IGNORE_MARKER.test(content.slice(0, match.index))) blocks.push(match[1]);
+  }
   return blocks;
 }
 
+function readQueue(queuePath) {
+  return fs.readFileSync(queuePath, 'utf8').split('\n').filter((line) => line.trim()).map((line) => JSON.parse(line));
+}
+
+function documentationBlocks() {
+  if (BLOCKS_DIR) return readQueue(path.join(BLOCKS_DIR, 'typescript.jsonl'));
+  return documentationFiles().flatMap((markdownPath) => extractTsBlocks(markdownPath).map((code) => ({
+    filename: path.relative(REPO_ROOT, markdownPath),
+    code,
+  })));
+}
+
+function checkAndReport(project, examples) {
+  const result = spawnSync(TSC, ['--project', project, '--pretty', 'false'], {cwd: TEMP_DIR, encoding: 'utf8'});
+  if (result.error) throw result.error;
+  const output = `${result.stdout}${result.stderr}`;
+  process.stdout.write(output);
+  const errors = new Map();
+  for (const line of output.split(/\r?\n/)) {
+    const match = line.match(/^(example-\d+\.ts)\(/);
+    if (match) errors.set(match[1], [...(errors.get(match[1]) || []), line]);
+  }
+  const results = [...examples].map(([filename, block]) => ({
+    filename: block.filename,
+    line: block.line,
+    ok: !errors.has(filename),
+    errors: errors.get(filename) || [],
+  }));
+  fs.writeFileSync(path.join(BLOCKS_DIR, 'typescript-results.json'), `${JSON.stringify(results, null, 2)}\n`);
+  if (result.status !== 0) process.exit(result.status ?? 1);
+}
+
 function installEnvironment() {
   fs.mkdirSync(NPM_ENV_DIR, {recursive: true});
   console.log(`Installing TypeScript test environment: pdfdancer-client-typescript==${SDK_VERSION}`);
@@ -126,15 +164,13 @@ function main() {
     process.platform === 'win32' ? 'junction' : 'dir',
   );
 
-  let fileNumber = 0;
-  let totalBlocks = 0;
-  for (const markdownPath of documentationFiles()) {
-    for (const block of extractTsBlocks(markdownPath)) {
-      totalBlocks += 1;
-      const filename = `example-${++fileNumber}.ts`;
-      fs.writeFileSync(path.join(TEMP_DIR, filename), testableCode(block));
-    }
+  const examples = new Map();
+  for (const block of documentationBlocks()) {
+    const filename = `example-${examples.size + 1}.ts`;
+    examples.set(filename, block);
+    fs.writeFileSync(path.join(TEMP_DIR, filename), testableCode(block.code));
   }
+  const totalBlocks = examples.size;
 
   fs.writeFileSync(path.join(TEMP_DIR, 'tsconfig.json'), JSON.stringify({
     compilerOptions: {
@@ -151,7 +187,9 @@ function main() {
   }, null, 2));
 
   console.log(`Checking ${totalBlocks} TypeScript blocks with TypeScript ${SDK_VERSION}`);
-  run(TSC, ['--project', path.join(TEMP_DIR, 'tsconfig.json')], {cwd: TEMP_DIR});
+  const project = path.join(TEMP_DIR, 'tsconfig.json');
+  if (BLOCKS_DIR) checkAndReport(project, examples);
+  else run(TSC, ['--project', project], {cwd: TEMP_DIR});
   fs.rmSync(TEMP_DIR, {recursive: true, force: true});
   console.log(`All ${totalBlocks} TypeScript blocks passed validation.`);
 }
@@ -1,6 +1,110 @@
 """Pytest configuration for documentation example tests."""
 
+import json
 import os
+from pathlib import Path
+
+import pytest
+
+pytest_plugins = ['doc_sharding']
 
 # Set up environment for anonymous API access
 os.environ.setdefault('PDFDANCER_BASE_URL', 'https://api.pdfdancer.com')
+
+# Per-block outcomes reported back to tests/doc_pipeline.py.
+BLOCK_RESULTS = []
+# Blocks that ran and failed in this session; dropped from the SDK usage index.
+FAILED_BLOCKS = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('pdfdancer-docs', 'PDFDancer documentation examples')
+    group.addoption(
+        '--sdk-usage-index',
+        metavar='PATH',
+        help='write the SDK member -> documentation block index to PATH after the run',
+    )
+    group.addoption(
+        '--affected-since',
+        metavar='PATH',
+        help='only validate blocks that are new or use SDK members that changed since the index at PATH',
+    )
+    group.addoption(
+        '--interface-diff',
+        metavar='PATH',
+        help='with --affected-since, also treat symbols changed in this v3-interface-diff.json as affected',
+    )
+
+
+def _read_json(path):
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError) as error:
+        raise pytest.UsageError(f'Could not read {path}: {error}') from error
+
+
+def pytest_collection_modifyitems(config, items):
+    index_path = config.getoption('--affected-since')
+    diff_path = config.getoption('--interface-diff')
+    if diff_path and not index_path:
+        raise pytest.UsageError('--interface-diff requires --affected-since')
+    if not index_path:
+        return
+
+    from test_python_docs import affected_blocks, changed_symbols_from_diff
+
+    changed = changed_symbols_from_diff(_read_json(diff_path)) if diff_path else set()
+    examples = [item for item in items if getattr(item, 'originalname', None) == 'test_python_examples']
+    selected = set(affected_blocks(
+        [item.callspec.params['block'] for item in examples],
+        _read_json(index_path),
+        changed,
+    ))
+    deselected = [item for item in examples if item.callspec.params['block'] not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item not in deselected]
+
+
+def pytest_collection_finish(session):
+    # Pay for loading the SDK before the first example is timed.
+    if any(getattr(item, 'originalname', None) == 'test_python_examples' for item in session.items):
+        from test_python_docs import warm_up_sdk
+
+        warm_up_sdk()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if getattr(item, 'originalname', None) != 'test_python_examples':
+        return
+    block = item.callspec.params['block']
+    if report.failed:
+        FAILED_BLOCKS.append(block)
+    if report.when != 'call':
+        return
+    errors = [] if call.excinfo is None else [f'{call.excinfo.typename}: {call.excinfo.value}']
+    BLOCK_RESULTS.append({'filename': block.filename, 'line': block.line, 'ok': report.passed, 'errors': errors})
+
+
+def pytest_sessionfinish(session):
+    from doc_blocks import BLOCKS_DIR_VARIABLE
+
+    blocks_dir = os.environ.get(BLOCKS_DIR_VARIABLE)
+    if blocks_dir:
+        results_path = Path(blocks_dir) / 'python-results.json'
+        results_path.write_text(json.dumps(BLOCK_RESULTS, indent=2) + '\n')
+
+    index_path = session.config.getoption('--sdk-usage-index')
+    if not index_path:
+        return
+
+    from test_python_docs import DOC_BLOCKS, SDK_USAGE, build_usage_index
+
+    path = Path(index_path)
+    previous = _read_json(path) if path.exists() else None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index = build_usage_index(SDK_USAGE, DOC_BLOCKS, previous, FAILED_BLOCKS)
+    path.write_text(json.dumps(index, indent=2, sort_keys=True) + '\n')
@@ -0,0 +1,240 @@
+"""Collect fenced code examples from the selected documentation tree.
+
+Every page is read once and its ``python``, ``typescript`` and ``java`` fences
+are sorted into per-language queues. The module only uses the standard
+library so that ``doc_pipeline.py`` can run it outside the test environments.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+import textwrap
+import typing
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DIR = Path(os.environ.get("PDFDANCER_DOCS_DIR", "docs"))
+if not DOCS_DIR.is_absolute():
+    DOCS_DIR = REPO_ROOT / DOCS_DIR
+IS_V1 = "versioned_docs" in DOCS_DIR.parts
+LANGUAGES = ("python", "typescript", "java")
+# When set, backends read their block queue from <dir>/<language>.jsonl, one
+# block per line, instead of scanning the pages, and write
+# <dir>/<language>-results.json.
+BLOCKS_DIR_VARIABLE = "PDFDANCER_DOCS_BLOCKS"
+# When set to 1, the Python harness keeps block positions instead of block
+# code and reads each block from its page when its test runs.
+LOW_MEMORY_VARIABLE = "PDFDANCER_DOCS_LOW_MEMORY"
+IGNORE_MARKER = re.compile(r"<!--\s*docs-test:\s*ignore\s*-->")
+
+
+class DocBlock(typing.NamedTuple):
+    """A fenced example and where it starts in its page."""
+
+    filename: str
+    line: int
+    code: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.filename}:{self.line}"
+
+    @property
+    def digest(self) -> str:
+        return _digest(self.code)
+
+    @property
+    def size(self) -> int:
+        return len(self.code)
+
+
+class BlockRef(typing.NamedTuple):
+    """A fenced example referenced by its character span in its page.
+
+    ``code`` reads the page again each time it is accessed, so a list of
+    references stays small however large the examples are.
+    """
+
+    filename: str
+    line: int
+    language: str
+    start: int
+    end: int
+    digest: str
+    size: int
+
+    @property
+    def id(self) -> str:
+        return f"{self.filename}:{self.line}"
+
+    @property
+    def code(self) -> str:
+        code = _block_code(self.language, (REPO_ROOT / self.filename).read_text(), self.start, self.end)
+        if _digest(code) != self.digest:
+            raise RuntimeError(f"{self.id} changed since it was scanned; rerun the tests on the current pages")
+        return code
+
+
+def _digest(code: str) -> str:
+    return hashlib.sha256(code.encode()).hexdigest()[:16]
+
+
+def canonical_digest(language: str, code: str) -> str:
+    """Hash a block's code without its formatting.
+
+    Python blocks are compared by AST, so comments and layout do not matter.
+    The TypeScript and Java backends choose a wrapper from the raw text, where
+    a comment can change the result, so those blocks only ignore indentation,
+    trailing blanks and empty lines. Blocks with the same digest give the same
+    validation result.
+    """
+    canonical = None
+    if language == "python":
+        try:
+            canonical = ast.dump(ast.parse(code))
+        except SyntaxError:
+            pass
+    if canonical is None:
+        canonical = "\n".join(line.strip() for line in code.splitlines() if line.strip())
+    return hashlib.sha256(f"{language}\0{canonical}".encode()).hexdigest()[:16]
+
+
+def group_by_content(language: str, blocks: list[DocBlock]) -> dict[str, list[DocBlock]]:
+    """Occurrences of each distinct block, in page order, keyed by canonical digest."""
+    groups: dict[str, list[DocBlock]] = {}
+    for block in blocks:
+        groups.setdefault(canonical_digest(language, block.code), []).append(block)
+    return groups
+
+
+def _is_generated_or_reference(path: Path) -> bool:
+    return bool({"reference", "generated"}.intersection(path.relative_to(DOCS_DIR).parts))
+
+
+def documentation_files(language: str) -> list[Path]:
+    """Pages whose ``language`` examples are validated for the selected tree."""
+    if IS_V1:
+        # v1 examples are validated on the published getting-started pages only;
+        # the other v1 pages contain legacy API snippets.
+        return [DOCS_DIR / f"getting-started-{language}.md"]
+    return sorted(
+        path
+        for path in DOCS_DIR.rglob("*.md")
+        if not _is_generated_or_reference(path)
+    )
+
+
+def _fence_language(opening: str) -> str | None:
+    info = opening.lstrip()[3:]
+    # mktestdocs-compatible for Python: the info string must be exactly
+    # "python". The Node backends also accepted trailing blanks.
+    if info == "python":
+        return "python"
+    info = info.rstrip(" \t\r")
+    return info if info in ("typescript", "java") else None
+
+
+def _fences(text: str) -> typing.Iterator[tuple[str, int, int, int]]:
+    """Yield (language, fence line, body start, body end) for each validated fence.
+
+    The body span covers the lines between the fences, each with its newline.
+    """
+    fence: tuple[int, str, int] | None = None
+    previous = ""
+    ignored = False
+    offset = 0
+    for number, line in enumerate(text.split("\n"), start=1):
+        line_start, offset = offset, offset + len(line) + 1
+        if "```" not in line:
+            if fence is None and line.strip():
+                previous = line
+            continue
+        if fence is None:
+            fence = (number, line, offset)
+            ignored = bool(IGNORE_MARKER.fullmatch(previous.strip()))
+            continue
+        start, opening, body_start = fence
+        language = _fence_language(opening)
+        if language is not None and line_start > body_start and not ignored:
+            yield language, start, body_start, line_start
+        fence = None
+        previous = line
+
+
+def _block_code(language: str, text: str, start: int, end: int) -> str:
+    # Python blocks are dedented like mktestdocs does; other languages keep
+    # their source verbatim.
+    code = text[start:end]
+    return textwrap.dedent(code) if language == "python" else code
+
+
+def scan_page(doc_file: Path) -> dict[str, list[DocBlock]]:
+    """Split one page into per-language blocks, skipping ignored fences."""
+    filename = str(doc_file.relative_to(REPO_ROOT))
+    text = doc_file.read_text()
+    blocks: dict[str, list[DocBlock]] = {language: [] for language in LANGUAGES}
+    for language, line, start, end in _fences(text):
+        blocks[language].append(DocBlock(filename, line, _block_code(language, text, start, end)))
+    return blocks
+
+
+def scan_page_refs(doc_file: Path, language: str) -> list[BlockRef]:
+    """References to one page's ``language`` blocks; the code is not kept."""
+    filename = sys.intern(str(doc_file.relative_to(REPO_ROOT)))
+    text = doc_file.read_text()
+    refs = []
+    for fence_language, line, start, end in _fences(text):
+        if fence_language == language:
+            code = _block_code(language, text, start, end)
+            refs.append(BlockRef(filename, line, language, start, end, _digest(code), len(code)))
+    return refs
+
+
+def collect_blocks(languages: typing.Iterable[str] = LANGUAGES) -> dict[str, list[DocBlock]]:
+    """Scan every selected page once and queue its blocks by language."""
+    pages_by_language = {language: set(documentation_files(language)) for language in languages}
+    queues: dict[str, list[DocBlock]] = {language: [] for language in pages_by_language}
+    for doc_file in sorted(set().union(*pages_by_language.values())):
+        if not doc_file.exists():
+            continue
+        for language, blocks in scan_page(doc_file).items():
+            if language in queues and doc_file in pages_by_language[language]:
+                queues[language].extend(blocks)
+    return queues
+
+
+def collect_block_refs(language: str) -> list[BlockRef]:
+    """References to every ``language`` block of the selected tree, one page at a time."""
+    refs: list[BlockRef] = []
+    for doc_file in documentation_files(language):
+        if doc_file.exists():
+            refs.extend(scan_page_refs(doc_file, language))
+    return refs
+
+
+def write_queue(directory: Path, language: str, blocks: list[DocBlock]) -> None:
+    with (directory / f"{language}.jsonl").open("w") as queue:
+        for block in blocks:
+            queue.write(json.dumps(block._asdict()) + "\n")
+
+
+def read_queue(directory: Path, language: str) -> list[DocBlock]:
+    with (directory / f"{language}.jsonl").open() as queue:
+        return [DocBlock(**json.loads(line)) for line in queue if line.strip()]
+
+
+def read_queue_ids(directory: Path, language: str) -> set[str]:
+    """Ids of the queued blocks, read one line at a time without keeping any code."""
+    ids: set[str] = set()
+    with (directory / f"{language}.jsonl").open() as queue:
+        for line in queue:
+            if line.strip():
+                block = json.loads(line)
+                ids.add(f"{block['filename']}:{block['line']}")
+    return ids
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Validate Python, TypeScript and Java documentation examples in one pass.
+
+Each page is scanned once. The blocks are queued per language, and the three
+language backends run concurrently on those queues, so wall time follows the
+slowest backend instead of the sum. The combined result is reported per page.
+
+TypeScript and Java blocks that appear more than once are queued once, and
+their result is copied to every occurrence. Python deduplicates inside
+pytest, where a failing copy is validated again to report its own lines.
+
+Usage: python3 tests/doc_pipeline.py [LANGUAGE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from doc_blocks import (
+    BLOCKS_DIR_VARIABLE,
+    DOCS_DIR,
+    LANGUAGES,
+    REPO_ROOT,
+    DocBlock,
+    collect_blocks,
+    group_by_content,
+    write_queue,
+)
+
+
+BACKENDS = {
+    "python": ["node", "scripts/test-python-docs.js"],
+    "typescript": ["node", "scripts/test-ts-docs.js"],
+    "java": ["node", "scripts/test-java-docs.js"],
+}
+# Backends whose queue holds one block per distinct content.
+DEDUPLICATED_BACKENDS = ("typescript", "java")
+
+
+def run_backend(language: str, blocks_dir: Path) -> tuple[int, float]:
+    """Run one backend on its queue; its output goes to <language>.log."""
+    started = time.monotonic()
+    with (blocks_dir / f"{language}.log").open("w") as log:
+        status = subprocess.run(
+            BACKENDS[language],
+            cwd=REPO_ROOT,
+            env={**os.environ, BLOCKS_DIR_VARIABLE: str(blocks_dir)},
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            check=False,
+        ).returncode
+    return status, time.monotonic() - started
+
+
+def run_backends(languages: list[str], blocks_dir: Path) -> dict[str, tuple[int, float]]:
+    """Start every backend at once and wait for all of them."""
+    with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+        futures = {language: executor.submit(run_backend, language, blocks_dir) for language in languages}
+        return {language: future.result() for language, future in futures.items()}
+
+
+def read_results(blocks_dir: Path, language: str) -> list[dict] | None:
+    path = blocks_dir / f"{language}-results.json"
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def fan_out(results: list[dict], groups: dict[str, list[DocBlock]]) -> list[dict]:
+    """Copy each validated block's result to the other occurrences of its content."""
+    by_location = {(result["filename"], result["line"]): result for result in results}
+    fanned = []
+    for occurrences in groups.values():
+        validated = occurrences[0]
+        result = by_location.get((validated.filename, validated.line))
+        if result is None:
+            continue
+        fanned.append(result)
+        fanned.extend(
+            {**result, "filename": block.filename, "line": block.line, "validatedAs": validated.id}
+            for block in occurrences[1:]
+        )
+    return fanned
+
+
+def report(
+    languages: list[str],
+    blocks_dir: Path,
+    finished: dict[str, tuple[int, float]],
+    groups: dict[str, dict[str, list[DocBlock]]],
+) -> bool:
+    """Print one line per page and the failing blocks; return overall success."""
+    pages: dict[str, dict[str, list[dict]]] = defaultdict(lambda: defaultdict(list))
+    succeeded = True
+    for language in languages:
+        status, seconds = finished[language]
+        results = read_results(blocks_dir, language)
+        if results is not None and language in groups:
+            results = fan_out(results, groups[language])
+        print(f"{language}: exit {status} in {seconds:.1f}s")
+        if status != 0:
+            succeeded = False
+        if status != 0 or results is None:
+            # Setup failures happen before any block runs; show the backend log.
+            print((blocks_dir / f"{language}.log").read_text())
+        for result in results or []:
+            pages[result["filename"]][language].append(result)
+
+    print()
+    for page in sorted(pages):
+        summary = []
+        for language in languages:
+            results = pages[page].get(language)
+            if results:
+                passed = sum(result["ok"] for result in results)
+                summary.append(f"{language} {passed}/{len(results)}")
+        print(f"{page}: {', '.join(summary)}")
+        for language in languages:
+            for result in pages[page].get(language, []):
+                if not result["ok"]:
+                    shared = f" (same as {result['validatedAs']})" if "validatedAs" in result else ""
+                    print(f"  {language} block at line {result['line']}{shared}:")
+                    for error in result["errors"]:
+                        print(f"    {error}")
+    return succeeded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("languages", nargs="*", metavar="LANGUAGE", help=f"any of {', '.join(LANGUAGES)} (default: all)")
+    arguments = parser.parse_args()
+    unknown = sorted(set(arguments.languages) - set(LANGUAGES))
+    if unknown:
+        parser.error(f"unknown language: {', '.join(unknown)}")
+    languages = [language for language in LANGUAGES if language in (arguments.languages or LANGUAGES)]
+
+    queues = collect_blocks(languages)
+    groups = {
+        language: group_by_content(language, queues[language])
+        for language in languages
+        if language in DEDUPLICATED_BACKENDS
+    }
+    counts = []
+    for language in languages:
+        count = f"{len(queues[language])} {language}"
+        if language in groups:
+            count += f" ({len(groups[language])} distinct)"
+        counts.append(count)
+    print(f"Validating {os.path.relpath(DOCS_DIR, REPO_ROOT)}: {', '.join(counts)} blocks")
+    with tempfile.TemporaryDirectory(prefix="pdfdancer-doc-blocks-") as directory:
+        blocks_dir = Path(directory)
+        for language in languages:
+            if language in groups:
+                write_queue(blocks_dir, language, [occurrences[0] for occurrences in groups[language].values()])
+            else:
+                write_queue(blocks_dir, language, queues[language])
+        finished = run_backends(languages, blocks_dir)
+        return 0 if report(languages, blocks_dir, finished, groups) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
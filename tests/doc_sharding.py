@@ -0,0 +1,155 @@
+"""Pytest plugin that splits the documentation tests across CI nodes.
+
+Every node runs pytest with the same ``--shard-count`` and durations file and
+its own ``--shard-index``. Tests are assigned longest-first to the currently
+lightest shard, which keeps the slowest shard close to the average. The
+assignment depends only on the collected tests and the durations file, so
+nodes agree on it without coordinating.
+
+Tests without a recorded duration are estimated from their block size. When
+no durations exist at all, block size is the weight.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('pdfdancer-docs')
+    group.addoption('--shard-count', type=int, default=1, metavar='N', help='split the tests into N shards')
+    group.addoption('--shard-index', type=int, default=0, metavar='I', help='run shard I (0-based) of --shard-count')
+    group.addoption(
+        '--shard-durations',
+        metavar='PATH',
+        help='durations recorded by --record-durations, used to balance the shards',
+    )
+    group.addoption(
+        '--record-durations',
+        metavar='PATH',
+        help='merge the duration of every test in this run into PATH',
+    )
+
+
+def duration_key(item) -> str:
+    """Key durations of documentation blocks by content so they survive line moves."""
+    block = _block(item)
+    return f'block:{block.digest}' if block is not None else item.nodeid
+
+
+def _block(item):
+    if getattr(item, 'originalname', None) != 'test_python_examples':
+        return None
+    return item.callspec.params['block']
+
+
+def _size(item) -> int | None:
+    block = _block(item)
+    return block.size if block is not None else None
+
+
+def estimate_weights(items, durations: dict[str, float]) -> dict[str, float]:
+    """Weight per nodeid: recorded seconds, otherwise an estimate from block size."""
+    sizes = {item.nodeid: _size(item) for item in items}
+    known_sizes = [size for size in sizes.values() if size is not None]
+    typical_size = statistics.median(known_sizes) if known_sizes else 1
+
+    recorded = {item.nodeid: durations[duration_key(item)] for item in items if duration_key(item) in durations}
+    if not recorded:
+        return {nodeid: float(size if size is not None else typical_size) for nodeid, size in sizes.items()}
+
+    per_character = [
+        seconds / sizes[nodeid] for nodeid, seconds in recorded.items() if sizes[nodeid]
+    ]
+    seconds_per_character = statistics.median(per_character) if per_character else None
+    typical_seconds = statistics.median(recorded.values())
+    weights = {}
+    for nodeid, size in sizes.items():
+        if nodeid in recorded:
+            weights[nodeid] = recorded[nodeid]
+        elif size is not None and seconds_per_character is not None:
+            weights[nodeid] = size * seconds_per_character
+        else:
+            weights[nodeid] = typical_seconds
+    return weights
+
+
+def assign_shards(weights: dict[str, float], shard_count: int) -> dict[str, int]:
+    """Greedy longest-processing-time assignment; ties break on nodeid and shard index."""
+    loads = [0.0] * shard_count
+    assignment = {}
+    for nodeid in sorted(weights, key=lambda nodeid: (-weights[nodeid], nodeid)):
+        shard = min(range(shard_count), key=lambda index: (loads[index], index))
+        assignment[nodeid] = shard
+        loads[shard] += weights[nodeid]
+    return assignment
+
+
+def _read_durations(path) -> dict[str, float]:
+    if path is None or not Path(path).exists():
+        return {}
+    try:
+        return json.loads(Path(path).read_text())
+    except json.JSONDecodeError as error:
+        raise pytest.UsageError(f'Could not read {path}: {error}') from error
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    count = config.getoption('--shard-count')
+    index = config.getoption('--shard-index')
+    if count < 1 or not 0 <= index < count:
+        raise pytest.UsageError(f'--shard-index must be between 0 and {count - 1}, and --shard-count at least 1')
+    if count == 1:
+        return
+
+    durations = _read_durations(config.getoption('--shard-durations'))
+    assignment = assign_shards(estimate_weights(items, durations), count)
+    deselected = [item for item in items if assignment[item.nodeid] != index]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if assignment[item.nodeid] == index]
+
+
+class DurationRecorder:
+    """Collect setup, call and teardown time per test for --record-durations.
+
+    Identical blocks on different pages share a key; the key keeps the
+    slowest of their tests rather than their sum.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.keys: dict[str, str] = {}
+        self.durations: dict[str, float] = {}
+
+    def pytest_collection_modifyitems(self, items):
+        self.keys.update((item.nodeid, duration_key(item)) for item in items)
+
+    def pytest_runtest_logreport(self, report):
+        if report.nodeid in self.keys:
+            self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def recorded(self) -> dict[str, float]:
+        """Seconds per duration key from this session."""
+        by_key: dict[str, float] = {}
+        for nodeid, seconds in self.durations.items():
+            key = self.keys[nodeid]
+            by_key[key] = max(by_key.get(key, 0.0), seconds)
+        return by_key
+
+    def pytest_sessionfinish(self):
+        durations = _read_durations(self.path)
+        durations.update((key, round(seconds, 6)) for key, seconds in self.recorded().items())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(durations, indent=2, sort_keys=True) + '\n')
+
+
+def pytest_configure(config):
+    path = config.getoption('--record-durations')
+    if path:
+        config.pluginmanager.register(DurationRecorder(Path(path)), 'doc-duration-recorder')
@@ -169,6 +169,31 @@ test('Python extractor honors __all__ and includes SDK-defined inherited members
   }
 });
 
+test('Python extractor profile attributes nested imports to the slow module', () => {
+  const root = fs.mkdtempSync(path.join(os.tmpdir(), 'interface-python-profile-test-'));
+  try {
+    const packageDirectory = path.join(root, 'pdfdancer');
+    fs.mkdirSync(packageDirectory);
+    fs.writeFileSync(path.join(packageDirectory, '__init__.py'), 'from .slow import Client\n__all__ = ["Client"]\n');
+    fs.writeFileSync(path.join(packageDirectory, 'slow.py'), 'import time\ntime.sleep(0.2)\nclass Client: pass\n');
+    const helper = path.resolve(__dirname, '../scripts/interface-extractors/extract-python.py');
+    const profilePath = path.join(root, 'profile.json');
+    childProcess.execFileSync('python3', [helper, '--profile', profilePath], {
+      encoding: 'utf8',
+      env: {...process.env, PYTHONPATH: root},
+    });
+    const modules = JSON.parse(fs.readFileSync(profilePath, 'utf8')).modules;
+    const slow = modules.find((record) => record.name === 'pdfdancer.slow');
+    const parent = modules.find((record) => record.name === 'pdfdancer');
+    assert.equal(modules[0].name, 'pdfdancer.slow');
+    assert.ok(slow.selfSeconds >= 0.2);
+    assert.ok(parent.seconds >= slow.seconds);
+    assert.ok(parent.selfSeconds < 0.2);
+  } finally {
+    fs.rmSync(root, {recursive: true, force: true});
+  }
+});
+
 test('TypeScript extractor resolves entry-point re-exports and overloads', () => {
   const root = fs.mkdtempSync(path.join(os.tmpdir(), 'interface-typescript-test-'));
   try {
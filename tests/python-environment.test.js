@@ -0,0 +1,71 @@
+'use strict';
+
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const test = require('node:test');
+const {environmentKey, evictEnvironments, sourceTreeDigest} = require('../scripts/python-environment');
+
+function temporaryDirectory() {
+  return fs.mkdtempSync(path.join(os.tmpdir(), 'pdfdancer-python-environment-'));
+}
+
+function readyEnvironment(root, name, bytes, lastUsed, manifest = {}) {
+  const directory = path.join(root, name);
+  fs.mkdirSync(directory);
+  fs.writeFileSync(path.join(directory, 'payload'), Buffer.alloc(bytes));
+  fs.writeFileSync(path.join(directory, 'environment.json'), `${JSON.stringify(manifest)}\n`);
+  fs.utimesSync(path.join(directory, 'environment.json'), lastUsed, lastUsed);
+  return directory;
+}
+
+test('environment key depends on the requirement set, not its order', () => {
+  const key = environmentKey({interpreter: 'Python 3.12', requirements: ['pytest', 'pdfdancer-client-python==3.0.2']});
+  assert.equal(key, environmentKey({interpreter: 'Python 3.12', requirements: ['pdfdancer-client-python==3.0.2', 'pytest']}));
+  assert.notEqual(key, environmentKey({interpreter: 'Python 3.12', requirements: ['pytest', 'pdfdancer-client-python==3.0.3']}));
+  assert.notEqual(key, environmentKey({interpreter: 'Python 3.13', requirements: ['pytest', 'pdfdancer-client-python==3.0.2']}));
+});
+
+test('source digest follows file contents and ignores build artifacts', () => {
+  const source = temporaryDirectory();
+  try {
+    fs.mkdirSync(path.join(source, 'src'));
+    fs.writeFileSync(path.join(source, 'src', 'client.py'), 'VERSION = 1\n');
+    const digest = sourceTreeDigest(source);
+    fs.mkdirSync(path.join(source, '__pycache__'));
+    fs.writeFileSync(path.join(source, '__pycache__', 'client.pyc'), 'compiled');
+    assert.equal(sourceTreeDigest(source), digest);
+    fs.writeFileSync(path.join(source, 'src', 'client.py'), 'VERSION = 2\n');
+    assert.notEqual(sourceTreeDigest(source), digest);
+  } finally {
+    fs.rmSync(source, {recursive: true, force: true});
+  }
+});
+
+test('eviction removes least recently used environments until the budget fits', () => {
+  const root = temporaryDirectory();
+  try {
+    const oldest = readyEnvironment(root, 'a', 1000, new Date(1000));
+    const current = readyEnvironment(root, 'b', 1000, new Date(2000));
+    const newest = readyEnvironment(root, 'c', 1000, new Date(3000));
+    fs.mkdirSync(path.join(root, 'd'));
+    assert.deepEqual(evictEnvironments(root, 2500, [current]), [oldest]);
+    assert.deepEqual(evictEnvironments(root, 1500, [current]), [newest]);
+    assert.ok(fs.existsSync(current));
+    assert.ok(fs.existsSync(path.join(root, 'd')));
+  } finally {
+    fs.rmSync(root, {recursive: true, force: true});
+  }
+});
+
+test('eviction trusts the size recorded at build time', () => {
+  const root = temporaryDirectory();
+  try {
+    const large = readyEnvironment(root, 'a', 10, new Date(1000), {size: 5000});
+    const current = readyEnvironment(root, 'b', 10, new Date(2000), {size: 10});
+    assert.deepEqual(evictEnvironments(root, 1000, [current]), [large]);
+  } finally {
+    fs.rmSync(root, {recursive: true, force: true});
+  }
+});
@@ -0,0 +1,99 @@
+"""Test the single-pass documentation block scanner."""
+
+import pytest
+
+import doc_blocks
+import doc_pipeline
+
+
+PAGE = """# Example
+
+```python
+pdf.page(1)
+```
+
+```typescript
+await pdf.page(1);
+```
+
+<!-- docs-test: ignore -->
+```java
+pdf.legacyCall();
+```
+
+```java title="Example.java"
+public class Example {}
+```
+"""
+
+
+class TestScanPage:
+    """Verify that one read of a page fills every language queue."""
+
+    def test_sorts_fences_by_language(self, tmp_path, monkeypatch):
+        """Blocks keep their page and fence line, and titled or ignored fences are skipped."""
+        monkeypatch.setattr(doc_blocks, "REPO_ROOT", tmp_path)
+        page = tmp_path / "page.md"
+        page.write_text(PAGE)
+        blocks = doc_blocks.scan_page(page)
+        assert blocks["python"] == [doc_blocks.DocBlock("page.md", 3, "pdf.page(1)\n")]
+        assert blocks["typescript"] == [doc_blocks.DocBlock("page.md", 7, "await pdf.page(1);\n")]
+        assert blocks["java"] == []
+
+    def test_references_read_the_same_code(self, tmp_path, monkeypatch):
+        """A block reference keeps only its position and reads the block scanned in full."""
+        monkeypatch.setattr(doc_blocks, "REPO_ROOT", tmp_path)
+        page = tmp_path / "page.md"
+        page.write_text(PAGE.replace("pdf.page(1)\n", "    pdf.page(1)\n", 1))
+        (block,) = doc_blocks.scan_page(page)["python"]
+        (ref,) = doc_blocks.scan_page_refs(page, "python")
+        assert "code" not in ref._fields
+        assert (ref.id, ref.code, ref.digest, ref.size) == (block.id, block.code, block.digest, block.size)
+
+    def test_queue_round_trip(self, tmp_path):
+        """Queues handed to the backends read back as the same blocks."""
+        blocks = [doc_blocks.DocBlock("docs/page.md", 3, "pdf.page(1)\n")]
+        doc_blocks.write_queue(tmp_path, "python", blocks)
+        assert doc_blocks.read_queue(tmp_path, "python") == blocks
+
+    def test_references_reject_a_changed_page(self, tmp_path, monkeypatch):
+        """A reference whose page changed after the scan fails instead of testing other code."""
+        monkeypatch.setattr(doc_blocks, "REPO_ROOT", tmp_path)
+        page = tmp_path / "page.md"
+        page.write_text(PAGE)
+        (ref,) = doc_blocks.scan_page_refs(page, "python")
+        page.write_text(PAGE.replace("pdf.page(1)", "pdf.page(2)", 1))
+        with pytest.raises(RuntimeError, match="page.md:3 changed"):
+            ref.code
+
+    def test_queue_ids_skip_the_code(self, tmp_path):
+        """The low-memory harness reads only the ids of the queued blocks."""
+        blocks = [doc_blocks.DocBlock("docs/a.md", 3, "pdf.page(1)\n"), doc_blocks.DocBlock("docs/b.md", 9, "x\n")]
+        doc_blocks.write_queue(tmp_path, "python", blocks)
+        assert doc_blocks.read_queue_ids(tmp_path, "python") == {"docs/a.md:3", "docs/b.md:9"}
+
+
+class TestContentGroups:
+    """Verify that equivalent blocks are validated once and reported everywhere."""
+
+    def test_python_blocks_group_by_syntax_tree(self):
+        """Comments and layout do not split a group; a code change does."""
+        first = doc_blocks.DocBlock("docs/a.md", 3, "pdf.page(1)  # first page\n")
+        copy = doc_blocks.DocBlock("versioned_docs/a.md", 9, "\n# first page\npdf.page( 1 )\n")
+        other = doc_blocks.DocBlock("docs/b.md", 3, "pdf.page(2)\n")
+        groups = doc_blocks.group_by_content("python", [first, copy, other])
+        assert list(groups.values()) == [[first, copy], [other]]
+
+    def test_java_comments_stay_significant(self):
+        """The Java wrapper reads comments, so only indentation is ignored."""
+        code = "pdf.save(path);\n"
+        assert doc_blocks.canonical_digest("java", code) == doc_blocks.canonical_digest("java", "    " + code)
+        assert doc_blocks.canonical_digest("java", code) != doc_blocks.canonical_digest("java", "// a class\n" + code)
+
+    def test_results_fan_out_to_every_occurrence(self):
+        """Each copy gets the validated block's result under its own page and line."""
+        first = doc_blocks.DocBlock("docs/a.md", 3, "pdf.save(path);\n")
+        copy = doc_blocks.DocBlock("docs/b.md", 7, "pdf.save(path);\n")
+        result = {"filename": "docs/a.md", "line": 3, "ok": False, "errors": ["error: x"]}
+        fanned = doc_pipeline.fan_out([result], doc_blocks.group_by_content("java", [first, copy]))
+        assert fanned == [result, {**result, "filename": "docs/b.md", "line": 7, "validatedAs": "docs/a.md:3"}]
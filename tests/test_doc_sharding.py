@@ -0,0 +1,53 @@
+"""Test the timing-balanced shard assignment."""
+
+from types import SimpleNamespace
+
+from doc_blocks import DocBlock
+from doc_sharding import DurationRecorder, assign_shards, duration_key, estimate_weights
+
+
+def _item(line, code):
+    block = DocBlock("docs/page.md", line, code)
+    return SimpleNamespace(
+        nodeid=f"tests/test_python_docs.py::test_python_examples[{block.id}]",
+        originalname="test_python_examples",
+        callspec=SimpleNamespace(params={"block": block}),
+    )
+
+
+class TestShardAssignment:
+    """Verify that shards are balanced and identical on every node."""
+
+    def test_longest_first_balances_the_slowest_shard(self):
+        """One heavy test gets a shard to itself instead of a contiguous half of the file order."""
+        weights = {"a": 6.0, "b": 1.0, "c": 1.0, "d": 1.0, "e": 1.0, "f": 2.0}
+        assignment = assign_shards(weights, 2)
+        loads = [sum(weight for nodeid, weight in weights.items() if assignment[nodeid] == shard) for shard in (0, 1)]
+        assert loads == [6.0, 6.0]
+
+    def test_assignment_is_independent_of_collection_order(self):
+        """Nodes that collect in a different order still compute the same shards."""
+        weights = {"a": 1.0, "b": 1.0, "c": 2.0, "d": 1.0}
+        reordered = dict(reversed(list(weights.items())))
+        assert assign_shards(weights, 3) == assign_shards(reordered, 3)
+
+    def test_block_size_is_the_fallback_weight(self):
+        """Without history, larger blocks weigh more."""
+        small, large = _item(3, "pdf.page(1)\n"), _item(9, "pdf.page(1)\n" * 10)
+        weights = estimate_weights([small, large], {})
+        assert weights[large.nodeid] == 10 * weights[small.nodeid]
+
+    def test_unrecorded_blocks_are_scaled_from_recorded_ones(self):
+        """New blocks are estimated in seconds from the recorded seconds per character."""
+        recorded, new = _item(3, "x = 1\n"), _item(9, "x = 1\n" * 4)
+        weights = estimate_weights([recorded, new], {duration_key(recorded): 0.5})
+        assert weights == {recorded.nodeid: 0.5, new.nodeid: 2.0}
+
+    def test_identical_blocks_record_one_duration(self, tmp_path):
+        """Copies of a block on two pages share a key without adding up their times."""
+        first, copy = _item(3, "pdf.page(1)\n"), _item(9, "pdf.page(1)\n")
+        recorder = DurationRecorder(tmp_path / "durations.json")
+        recorder.pytest_collection_modifyitems([first, copy])
+        for nodeid, seconds in ((first.nodeid, 0.25), (first.nodeid, 0.5), (copy.nodeid, 0.5)):
+            recorder.pytest_runtest_logreport(SimpleNamespace(nodeid=nodeid, duration=seconds))
+        assert recorder.recorded() == {duration_key(first): 0.75}
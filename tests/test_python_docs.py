@@ -11,20 +11,28 @@ import inspect
 import json
 import os
 import re
+import sys
 import typing
 from pathlib import Path
 from types import ModuleType
 from typing import Any
 
-import mktestdocs
 import pytest
 
+from doc_blocks import (
+    BLOCKS_DIR_VARIABLE,
+    DOCS_DIR,
+    IS_V1,
+    LOW_MEMORY_VARIABLE,
+    BlockRef,
+    DocBlock,
+    canonical_digest,
+    collect_block_refs,
+    collect_blocks,
+    read_queue,
+    read_queue_ids,
+)
 
-REPO_ROOT = Path(__file__).parent.parent
-DOCS_DIR = Path(os.environ.get("PDFDANCER_DOCS_DIR", "docs"))
-if not DOCS_DIR.is_absolute():
-    DOCS_DIR = REPO_ROOT / DOCS_DIR
-IS_V1 = "versioned_docs" in DOCS_DIR.parts
 METADATA_FILE = DOCS_DIR / "sdk-versions.md"
 
 
@@ -43,68 +51,263 @@ SDK_METADATA = _read_sdk_metadata()
 EXPECTED_SDK_VERSION = SDK_METADATA["python"]["version"]
 
 
-def _is_generated_or_reference(path: Path) -> bool:
-    return bool({"reference", "generated"}.intersection(path.relative_to(DOCS_DIR).parts))
-
-
-if IS_V1:
-    DOC_FILES = [DOCS_DIR / "getting-started-python.md"]
+LOW_MEMORY = os.environ.get(LOW_MEMORY_VARIABLE) == "1"
+DOC_BLOCKS: list[DocBlock] | list[BlockRef]
+if LOW_MEMORY:
+    # Keep where each block is, not its code; a test reads its block when it runs.
+    DOC_BLOCKS = collect_block_refs("python")
+    if os.environ.get(BLOCKS_DIR_VARIABLE):
+        queued = read_queue_ids(Path(os.environ[BLOCKS_DIR_VARIABLE]), "python")
+        DOC_BLOCKS = [ref for ref in DOC_BLOCKS if ref.id in queued]
+        del queued
+elif os.environ.get(BLOCKS_DIR_VARIABLE):
+    DOC_BLOCKS = read_queue(Path(os.environ[BLOCKS_DIR_VARIABLE]), "python")
 else:
-    DOC_FILES = sorted(
-        path
-        for path in DOCS_DIR.rglob("*.md")
-        if not _is_generated_or_reference(path)
-    )
-
-
-DOC_BLOCKS = [
-    (
-        str(doc_file.relative_to(REPO_ROOT)),
-        block,
-    )
-    for doc_file in DOC_FILES
-    if doc_file.exists()
-    for block in mktestdocs.grab_code_blocks(
-        re.sub(
-            r"<!--\s*docs-test:\s*ignore\s*-->\s*```python[ \t]*\r?\n[\s\S]*?```",
-            "",
-            doc_file.read_text(),
-        ),
-        lang="python",
-    )
-]
+    DOC_BLOCKS = collect_blocks(("python",))["python"]
 
 
 ANY_TYPE = object()
 UNKNOWN_TYPE = object()
 TYPING_SELF = getattr(typing, "Self", object())
-SDK_CLASSES: dict[str, type] = {}
-METHODS_BY_TYPE: dict[object, set[str]] = {}
-RETURN_TYPES: dict[tuple[type, str], object] = {}
 SDK_ENVIRONMENT_LOADED = False
 
 
-def _public_members(value: object) -> set[str]:
-    return {name for name in dir(value) if not name.startswith("_")}
+BUILTIN_NAMES = frozenset(dir(_builtins_module))
 
 
-def _register_type(name: str, value: object) -> None:
-    if inspect.isclass(value):
-        SDK_CLASSES[name] = value
-        METHODS_BY_TYPE[value] = _public_members(value)
+def _public_members(value: object) -> frozenset[str]:
+    # Interned, so the member sets of all SDK classes share their name strings.
+    return frozenset(sys.intern(name) for name in dir(value) if not name.startswith("_"))
 
 
-def _set_return_type(class_name: str, method_names: tuple[str, ...], return_name: str) -> None:
-    receiver = SDK_CLASSES.get(class_name)
-    returned = SDK_CLASSES.get(return_name)
-    if receiver is None or returned is None:
-        return
-    for method_name in method_names:
-        RETURN_TYPES[(receiver, method_name)] = returned
+# Where SDK classes are looked up by name, in registration order: a class
+# from a later source shadows one of the same name from an earlier source.
+# Each entry is (module, names, required); names is a tuple of class names,
+# "__all__" for the module's exports, or None for every public name.
+if IS_V1:
+    _CORE_SOURCE = ("pdfdancer.pdfdancer_v1", ("PageClient", "TextObjectRef"), True)
+else:
+    _CORE_SOURCE = ("pdfdancer.pdfdancer_v2", ("PageClient", "TextClient"), True)
+SDK_TYPE_SOURCES: list[tuple[str, tuple[str, ...] | str | None, bool]] = [
+    ("pdfdancer", ("PDFDancer",), True),
+    _CORE_SOURCE,
+    # Public package classes, so imported request builders and models are
+    # checked as well as the core client classes.
+    ("pdfdancer", "__all__", False),
+    ("pdfdancer.types", None, True),
+    *([] if IS_V1 else [("pdfdancer.text_editing", None, True)]),
+    # Builder modules are version-specific; the core API sources above
+    # remain mandatory for the selected package version.
+    ("pdfdancer.page_builder", ("PageBuilder",), False),
+    ("pdfdancer.image_builder", ("ImageBuilder", "ImageOnPageBuilder"), False),
+    ("pdfdancer.path_builder", ("PathBuilder", "LineBuilder", "BezierBuilder", "RectangleBuilder"), False),
+]
+
+# Explicit return mappings cover the fluent API methods used by fragments.
+RETURN_TYPE_NAMES: dict[tuple[str, str], str] = {
+    ("PDFDancer", "open"): "PDFDancer",
+    ("PDFDancer", "new"): "PDFDancer",
+    ("PDFDancer", "page"): "PageClient",
+    ("PDFDancer", "text"): "TextClient",
+    ("PDFDancer", "new_page"): "PageBuilder",
+    ("PDFDancer", "new_image"): "ImageBuilder",
+    ("PDFDancer", "new_path"): "PathBuilder",
+    ("PDFDancer", "new_line"): "LineBuilder",
+    ("PDFDancer", "new_bezier"): "BezierBuilder",
+    ("PDFDancer", "new_rectangle"): "RectangleBuilder",
+    ("PageClient", "text"): "TextClient",
+    ("PageClient", "new_image"): "ImageOnPageBuilder",
+    ("PageClient", "new_path"): "PathBuilder",
+    ("PageClient", "new_line"): "LineBuilder",
+    ("PageClient", "new_bezier"): "BezierBuilder",
+    ("PageClient", "new_rectangle"): "RectangleBuilder",
+    ("PageClient", "select_image_at"): "ImageObject",
+    ("PageClient", "select_image"): "ImageObject",
+    ("PageClient", "select_form_at"): "FormObject",
+    ("PageClient", "select_form"): "FormObject",
+    ("PageClient", "select_form_field_at"): "FormFieldObject",
+    ("PageClient", "select_form_field_by_name"): "FormFieldObject",
+    ("PageClient", "select_path_at"): "PathObject",
+    ("PageClient", "select_path"): "PathObject",
+}
+
+
+class CallSignature(typing.NamedTuple):
+    """Precompiled parameters of an SDK method, after ``self`` or ``cls``."""
+
+    positional: tuple[str, ...]
+    positional_only: int
+    required_positional: int
+    keyword_only: frozenset[str]
+    required_keyword_only: frozenset[str]
+    var_positional: bool
+    var_keyword: bool
+
+    @classmethod
+    def compile(cls, function: object, bound: bool) -> CallSignature | None:
+        try:
+            parameters = list(inspect.signature(function).parameters.values())
+        except (TypeError, ValueError):
+            return None
+        if bound:
+            if not parameters or parameters[0].kind not in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                return None
+            parameters = parameters[1:]
+
+        positional = [
+            parameter
+            for parameter in parameters
+            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        keyword_only = [parameter for parameter in parameters if parameter.kind is inspect.Parameter.KEYWORD_ONLY]
+        return cls(
+            positional=tuple(parameter.name for parameter in positional),
+            positional_only=sum(parameter.kind is inspect.Parameter.POSITIONAL_ONLY for parameter in positional),
+            required_positional=sum(parameter.default is inspect.Parameter.empty for parameter in positional),
+            keyword_only=frozenset(parameter.name for parameter in keyword_only),
+            required_keyword_only=frozenset(
+                parameter.name for parameter in keyword_only if parameter.default is inspect.Parameter.empty
+            ),
+            var_positional=any(parameter.kind is inspect.Parameter.VAR_POSITIONAL for parameter in parameters),
+            var_keyword=any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters),
+        )
+
+    def check(self, positional_count: int, keywords: list[str]) -> list[str]:
+        """Describe every way a call with these arguments fails to bind."""
+        problems = []
+        if not self.var_positional and positional_count > len(self.positional):
+            problems.append(
+                f"takes {len(self.positional)} positional arguments but {positional_count} were given"
+            )
+        for keyword in keywords:
+            if keyword in self.positional[self.positional_only:positional_count]:
+                problems.append(f"got multiple values for argument '{keyword}'")
+            elif keyword not in self.keyword_only and keyword not in self.positional[self.positional_only:]:
+                if not self.var_keyword:
+                    problems.append(f"got an unexpected keyword argument '{keyword}'")
+        supplied = set(self.positional[:positional_count]).union(keywords)
+        missing = [name for name in self.positional[:self.required_positional] if name not in supplied]
+        missing.extend(sorted(self.required_keyword_only.difference(keywords)))
+        if missing:
+            problems.append(f"missing required arguments: {', '.join(missing)}")
+        return problems
+
+
+class SdkUsage(typing.NamedTuple):
+    """The SDK members a block uses, as ``module:Qualified.member``.
+
+    ``covered`` is false when the block also touches SDK values that no usage
+    fingerprints, such as attributes read from the SDK or calls on ``Any``.
+    """
+
+    symbols: frozenset[str]
+    covered: bool
+
+
+class SdkTypeRegistry:
+    """SDK classes and their public members, resolved on first use and cached.
+
+    A source module is imported only when a lookup reaches it, and member
+    sets and binding tables are built only for classes an example uses.
+    Importing ``pdfdancer`` itself loads every SDK submodule, so the saving
+    is in introspection, not in imports.
+    """
+
+    def __init__(self, sources: list[tuple[str, tuple[str, ...] | str | None, bool]]):
+        self._sources = sources
+        self._classes: dict[str, type | None] = {}
+        self._known: set[type] = set()
+        self._members: dict[type, frozenset[str]] = {}
+        self._signatures: dict[type, dict[str, CallSignature]] = {}
+
+    def register(self, name: str, value: object) -> None:
+        """Record a class under the name an example imported it as."""
+        if inspect.isclass(value):
+            self._classes[name] = value
+            self._known.add(value)
+
+    def get(self, name: str, default: object = None) -> object:
+        if name not in self._classes:
+            self._classes[name] = self._lookup(name)
+            if self._classes[name] is not None:
+                self._known.add(self._classes[name])
+        value = self._classes[name]
+        return default if value is None else value
+
+    def is_sdk_class(self, value: object) -> bool:
+        return inspect.isclass(value) and (value in self._known or self.get(value.__name__) is value)
+
+    def members(self, value: type) -> frozenset[str]:
+        if value not in self._members:
+            self._members[value] = _public_members(value)
+        return self._members[value]
+
+    def signatures(self, value: type) -> dict[str, CallSignature]:
+        """Binding table for every public method of ``value``, compiled once.
+
+        The constructor is listed as ``__init__`` when the class defines it in
+        Python.
+        """
+        if value not in self._signatures:
+            table = {}
+            for name in (*self.members(value), "__init__"):
+                try:
+                    raw = inspect.getattr_static(value, name)
+                except AttributeError:
+                    continue
+                if isinstance(raw, (staticmethod, classmethod)):
+                    compiled = CallSignature.compile(raw.__func__, isinstance(raw, classmethod))
+                elif inspect.isfunction(raw):
+                    compiled = CallSignature.compile(raw, True)
+                else:
+                    continue
+                if compiled is not None:
+                    table[name] = compiled
+            self._signatures[value] = table
+        return self._signatures[value]
+
+    def _lookup(self, name: str) -> type | None:
+        for module_name, names, required in reversed(self._sources):
+            if isinstance(names, tuple) and name not in names:
+                continue
+            if names is None and name.startswith("_"):
+                continue
+            try:
+                module = importlib.import_module(module_name)
+            except ModuleNotFoundError as error:
+                if required:
+                    raise self._load_error() from error
+                continue
+            except ImportError as error:
+                raise self._load_error() from error
+            if names == "__all__" and name not in getattr(module, "__all__", ()):
+                continue
+            if required and isinstance(names, tuple) and not hasattr(module, name):
+                raise self._load_error()
+            value = getattr(module, name, None)
+            if inspect.isclass(value):
+                return value
+        return None
+
+    @staticmethod
+    def _load_error() -> RuntimeError:
+        return RuntimeError(
+            f"Could not load the documented SDK API from pdfdancer-client-python {EXPECTED_SDK_VERSION}"
+        )
+
+
+SDK_TYPES = SdkTypeRegistry(SDK_TYPE_SOURCES)
 
 
 def _load_sdk_environment() -> None:
-    """Load the installed PyPI SDK and build a runtime method/type registry."""
+    """Check that the installed PyPI SDK is the documented version.
+
+    SDK classes are resolved lazily by ``SDK_TYPES``; only the pin is
+    enforced up front.
+    """
     global SDK_ENVIRONMENT_LOADED
     if SDK_ENVIRONMENT_LOADED:
         return
@@ -122,80 +325,25 @@ def _load_sdk_environment() -> None:
             f"documented version {EXPECTED_SDK_VERSION}"
         )
 
-    try:
-        pdfdancer = importlib.import_module("pdfdancer")
-        _register_type("PDFDancer", getattr(pdfdancer, "PDFDancer"))
+    SDK_ENVIRONMENT_LOADED = True
 
-        if IS_V1:
-            sdk_module = importlib.import_module("pdfdancer.pdfdancer_v1")
-            for name in ("PageClient", "TextObjectRef"):
-                _register_type(name, getattr(sdk_module, name))
-        else:
-            sdk_module = importlib.import_module("pdfdancer.pdfdancer_v2")
-            for name in ("PageClient", "TextClient"):
-                _register_type(name, getattr(sdk_module, name))
-
-        # Register public package classes so imported request builders and models
-        # are checked as well as the core client classes.
-        for name in getattr(pdfdancer, "__all__", ()):
-            value = getattr(pdfdancer, name, None)
-            _register_type(name, value)
-
-        type_modules = ["pdfdancer.types"]
-        if not IS_V1:
-            type_modules.append("pdfdancer.text_editing")
-        for module_name in type_modules:
-            module = importlib.import_module(module_name)
-            for name in dir(module):
-                if not name.startswith("_"):
-                    _register_type(name, getattr(module, name))
-
-        builder_modules = {
-            "pdfdancer.page_builder": ("PageBuilder",),
-            "pdfdancer.image_builder": ("ImageBuilder", "ImageOnPageBuilder"),
-            "pdfdancer.path_builder": ("PathBuilder", "LineBuilder", "BezierBuilder", "RectangleBuilder"),
-        }
-        for module_name, names in builder_modules.items():
-            try:
-                module = importlib.import_module(module_name)
-            except ModuleNotFoundError:
-                # Builder modules are version-specific; the core API imports
-                # above remain mandatory for the selected package version.
-                continue
-            for name in names:
-                _register_type(name, getattr(module, name, None))
 
-    except (ImportError, AttributeError) as error:
-        raise RuntimeError(
-            f"Could not load the documented SDK API from pdfdancer-client-python {installed_version}"
-        ) from error
+def _is_sdk_value(value: object) -> bool:
+    if isinstance(value, ModuleType):
+        module_name = value.__name__
+    elif inspect.isclass(value):
+        module_name = value.__module__
+    else:
+        return False
+    return module_name.split(".", 1)[0] == "pdfdancer"
 
-    # Explicit return mappings cover the fluent API methods used by fragments.
-    _set_return_type("PDFDancer", ("open", "new"), "PDFDancer")
-    _set_return_type("PDFDancer", ("page",), "PageClient")
-    _set_return_type("PDFDancer", ("text",), "TextClient")
-    _set_return_type("PDFDancer", ("new_page",), "PageBuilder")
-    _set_return_type("PDFDancer", ("new_image",), "ImageBuilder")
-    _set_return_type("PDFDancer", ("new_path",), "PathBuilder")
-    _set_return_type("PDFDancer", ("new_line",), "LineBuilder")
-    _set_return_type("PDFDancer", ("new_bezier",), "BezierBuilder")
-    _set_return_type("PDFDancer", ("new_rectangle",), "RectangleBuilder")
-    _set_return_type("PageClient", ("text",), "TextClient")
-    _set_return_type("PageClient", ("new_image",), "ImageOnPageBuilder")
-    _set_return_type("PageClient", ("new_path",), "PathBuilder")
-    _set_return_type("PageClient", ("new_line",), "LineBuilder")
-    _set_return_type("PageClient", ("new_bezier",), "BezierBuilder")
-    _set_return_type("PageClient", ("new_rectangle",), "RectangleBuilder")
-    _set_return_type("PageClient", ("select_image_at", "select_image"), "ImageObject")
-    _set_return_type("PageClient", ("select_form_at", "select_form"), "FormObject")
-    _set_return_type(
-        "PageClient",
-        ("select_form_field_at", "select_form_field_by_name"),
-        "FormFieldObject",
-    )
-    _set_return_type("PageClient", ("select_path_at", "select_path"), "PathObject")
 
-    SDK_ENVIRONMENT_LOADED = True
+def _explicit_return_type(receiver_type: type, method_name: str) -> object:
+    receiver_name = receiver_type.__name__
+    return_name = RETURN_TYPE_NAMES.get((receiver_name, method_name))
+    if return_name is None or SDK_TYPES.get(receiver_name) is not receiver_type:
+        return UNKNOWN_TYPE
+    return SDK_TYPES.get(return_name, UNKNOWN_TYPE)
 
 
 def _resolve_import(module_name: str, name: str) -> object:
@@ -215,11 +363,11 @@ def _return_type_for(receiver_type: object, method_name: str) -> object:
 
         if return_annotation is TYPING_SELF or return_annotation is receiver_type:
             return receiver_type
-        if inspect.isclass(return_annotation) and return_annotation in METHODS_BY_TYPE:
+        if SDK_TYPES.is_sdk_class(return_annotation):
             return return_annotation
         if isinstance(return_annotation, str):
             name = return_annotation.strip("'\"").rsplit(".", 1)[-1]
-            return SDK_CLASSES.get(name, UNKNOWN_TYPE)
+            return SDK_TYPES.get(name, UNKNOWN_TYPE)
 
         # Optional[T] can still provide a useful receiver type for a
         # subsequent call after the example's explicit None check.
@@ -228,7 +376,7 @@ def _return_type_for(receiver_type: object, method_name: str) -> object:
             candidates = [
                 argument
                 for argument in typing.get_args(return_annotation)
-                if inspect.isclass(argument) and argument in METHODS_BY_TYPE
+                if SDK_TYPES.is_sdk_class(argument)
             ]
             if len(candidates) == 1:
                 return candidates[0]
@@ -236,12 +384,12 @@ def _return_type_for(receiver_type: object, method_name: str) -> object:
             candidates = [
                 argument
                 for argument in typing.get_args(return_annotation)
-                if inspect.isclass(argument) and argument in METHODS_BY_TYPE
+                if SDK_TYPES.is_sdk_class(argument)
             ]
             if len(candidates) == 1:
                 return ("collection", candidates[0])
 
-    return RETURN_TYPES.get((receiver_type, method_name), UNKNOWN_TYPE)
+    return _explicit_return_type(receiver_type, method_name)
 
 
 class UndefinedNameChecker(ast.NodeVisitor):
@@ -307,7 +455,7 @@ class UndefinedNameChecker(ast.NodeVisitor):
 
     def check(self):
         for name, lineno in self.used:
-            if name not in self.defined and name not in set(dir(_builtins_module)):
+            if name not in self.defined and name not in BUILTIN_NAMES:
                 self.errors.append(f"Undefined name '{name}' at line {lineno}")
 
 
@@ -317,23 +465,31 @@ class MethodCallValidator(ast.NodeVisitor):
     def __init__(self):
         _load_sdk_environment()
         self.symbol_types: dict[str, object] = {
-            "pdf": SDK_CLASSES.get("PDFDancer", UNKNOWN_TYPE),
-            "page": SDK_CLASSES.get("PageClient", UNKNOWN_TYPE),
-            "image": SDK_CLASSES.get("ImageObject", ANY_TYPE),
-            "path": SDK_CLASSES.get("PathObject", ANY_TYPE),
-            "form": SDK_CLASSES.get("FormObject", ANY_TYPE),
-            "field": SDK_CLASSES.get("FormFieldObject", ANY_TYPE),
-            "response": SDK_CLASSES.get("TextEditResponse", ANY_TYPE),
+            "pdf": SDK_TYPES.get("PDFDancer", UNKNOWN_TYPE),
+            "page": SDK_TYPES.get("PageClient", UNKNOWN_TYPE),
+            "image": SDK_TYPES.get("ImageObject", ANY_TYPE),
+            "path": SDK_TYPES.get("PathObject", ANY_TYPE),
+            "form": SDK_TYPES.get("FormObject", ANY_TYPE),
+            "field": SDK_TYPES.get("FormFieldObject", ANY_TYPE),
+            "response": SDK_TYPES.get("TextEditResponse", ANY_TYPE),
             "request": ANY_TYPE,
             "selected": ANY_TYPE,
             "result": ANY_TYPE,
         }
         self.errors: list[str] = []
-
-    def _register_import(self, name: str, value: object) -> None:
+        self.call_errors: list[str] = []
+        self.usages: set[str] = set()
+        self.covered = True
+        # Names imported from pdfdancer: name -> (module, attribute, value).
+        self._sdk_imports: dict[str, tuple[str, str, object]] = {}
+        self._callees: set[int] = set()
+
+    def _register_import(self, name: str, value: object, source: tuple[str, str] | None = None) -> None:
         self.symbol_types[name] = value if value is not None else UNKNOWN_TYPE
         if inspect.isclass(value):
-            _register_type(name, value)
+            SDK_TYPES.register(name, value)
+        if source is not None and source[0].split(".", 1)[0] == "pdfdancer":
+            self._sdk_imports[name] = (*source, value)
 
     def _infer_expr_type(self, node: ast.AST) -> object:
         if isinstance(node, ast.Name):
@@ -377,15 +533,19 @@ class MethodCallValidator(ast.NodeVisitor):
                     try:
                         module = importlib.import_module(node.module)
                         for name in getattr(module, "__all__", ()):
-                            self._register_import(name, getattr(module, name))
+                            self._register_import(name, getattr(module, name), (node.module, name))
                     except ImportError:
                         pass
                 else:
                     name = alias.asname or alias.name
                     try:
-                        self._register_import(name, _resolve_import(node.module, alias.name))
+                        self._register_import(name, _resolve_import(node.module, alias.name), (node.module, alias.name))
                     except (ImportError, AttributeError):
                         self._register_import(name, UNKNOWN_TYPE)
+                    else:
+                        # An explicit import fails when the name disappears,
+                        # whether or not the block goes on to use it.
+                        self._record_usage(node.module, alias.name)
         self.generic_visit(node)
 
     def visit_AnnAssign(self, node):
@@ -400,7 +560,7 @@ class MethodCallValidator(ast.NodeVisitor):
 
     def _annotation_type(self, annotation: ast.AST) -> object:
         if isinstance(annotation, ast.Name):
-            return SDK_CLASSES.get(annotation.id, self.symbol_types.get(annotation.id, UNKNOWN_TYPE))
+            return SDK_TYPES.get(annotation.id, self.symbol_types.get(annotation.id, UNKNOWN_TYPE))
         return UNKNOWN_TYPE
 
     def visit_Assign(self, node):
@@ -421,61 +581,128 @@ class MethodCallValidator(ast.NodeVisitor):
             self.symbol_types[node.target.id] = ANY_TYPE
         self.generic_visit(node)
 
+    def _record_usage(self, module_name: str, attribute_path: str) -> None:
+        if module_name.split(".", 1)[0] == "pdfdancer":
+            self.usages.add(sys.intern(f"{module_name}:{attribute_path}"))
+
+    def visit_Name(self, node):
+        # Names from ``from pdfdancer import *`` count once a block uses them.
+        imported = self._sdk_imports.get(node.id)
+        if isinstance(node.ctx, ast.Load) and imported and self.symbol_types.get(node.id) is imported[2]:
+            self._record_usage(imported[0], imported[1])
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        # Called members are fingerprinted by visit_Call; any other read of an
+        # SDK value is a dependency the usage index cannot describe.
+        if isinstance(node.ctx, ast.Load) and id(node) not in self._callees:
+            receiver = self._infer_expr_type(node.value)
+            if receiver is ANY_TYPE or _is_sdk_value(receiver):
+                self.covered = False
+        self.generic_visit(node)
+
     def visit_Call(self, node):
+        self._callees.add(id(node.func))
         if isinstance(node.func, ast.Attribute):
             receiver = self._infer_expr_type(node.func.value)
             method_name = node.func.attr
-            if receiver is not ANY_TYPE:
+            if receiver is ANY_TYPE:
+                self.covered = False
+            else:
                 if receiver is UNKNOWN_TYPE:
                     self.errors.append(
                         f"Unresolved receiver for '.{method_name}()' at line {node.lineno}"
                     )
                 elif isinstance(receiver, ModuleType):
+                    self._record_usage(receiver.__name__, method_name)
                     if not hasattr(receiver, method_name):
                         self.errors.append(
                             f"Module '{receiver.__name__}' has no member '{method_name}' at line {node.lineno}"
                         )
+                    else:
+                        self._check_constructor(getattr(receiver, method_name), node)
                 elif inspect.isclass(receiver):
-                    valid_methods = METHODS_BY_TYPE.get(receiver, _public_members(receiver))
+                    self._record_usage(receiver.__module__, f"{receiver.__qualname__}.{method_name}")
+                    valid_methods = SDK_TYPES.members(receiver)
                     if method_name not in valid_methods:
                         similar = sorted(m for m in valid_methods if m.startswith(method_name[:8]))
                         suggestion = f" Did you mean: {', '.join(similar[:3])}?" if similar else ""
                         self.errors.append(
                             f"'{receiver.__name__}' has no method '{method_name}' at line {node.lineno}.{suggestion}"
                         )
+                    elif receiver.__module__.split(".", 1)[0] == "pdfdancer":
+                        self._check_arguments(receiver, method_name, node)
+        elif isinstance(node.func, ast.Name):
+            self._check_constructor(self._infer_expr_type(node.func), node)
         self.generic_visit(node)
 
-
-def validate_python_syntax(code: str, filename: str = "<doc>") -> None:
-    """Validate syntax, imports, names, and SDK method calls."""
+    def _check_constructor(self, value: object, node: ast.Call) -> None:
+        if inspect.isclass(value) and value.__module__.split(".", 1)[0] == "pdfdancer":
+            self._record_usage(value.__module__, value.__qualname__)
+            self._check_arguments(value, "__init__", node)
+
+    def _check_arguments(self, receiver: type, method_name: str, node: ast.Call) -> None:
+        # *args and **kwargs hide the argument shape; leave those calls alone.
+        if any(isinstance(argument, ast.Starred) for argument in node.args):
+            return
+        if any(keyword.arg is None for keyword in node.keywords):
+            return
+        signature = SDK_TYPES.signatures(receiver).get(method_name)
+        if signature is None:
+            return
+        callee = receiver.__name__ if method_name == "__init__" else f"{receiver.__name__}.{method_name}"
+        for problem in signature.check(len(node.args), [keyword.arg for keyword in node.keywords]):
+            self.call_errors.append(f"'{callee}()' {problem} at line {node.lineno}")
+
+
+def validate_python_syntax(code: str, filename: str = "<doc>") -> SdkUsage:
+    """Validate syntax, imports, names, and SDK method calls and their arguments.
+
+    Returns the SDK names the code imports, constructs or calls, as
+    ``module:Qualified.member``.
+    """
     compile(code, filename, "exec")
     tree = ast.parse(code)
-
+    usages, error = _check_tree(tree)
+    # Raise only after the tree and the visitors are gone, so a traceback kept
+    # after a failure (sys.last_traceback, --pdb, reporting plugins) does not
+    # keep them alive through the frames that raised.
+    del tree
+    if error is not None:
+        raise error
+    return usages
+
+
+def _check_tree(tree: ast.Module) -> tuple[SdkUsage | None, Exception | None]:
+    """Return the SDK usages of ``tree``, or the first problem found in it."""
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
                 module_name = alias.name.split(".")[0]
                 if importlib.util.find_spec(module_name) is None:
-                    raise ModuleNotFoundError(f"No module named '{module_name}'")
+                    return None, ModuleNotFoundError(f"No module named '{module_name}'")
         elif isinstance(node, ast.ImportFrom) and node.module:
             module_name = node.module.split(".")[0]
             if importlib.util.find_spec(module_name) is None:
-                raise ModuleNotFoundError(f"No module named '{module_name}'")
+                return None, ModuleNotFoundError(f"No module named '{module_name}'")
             module = __import__(node.module, fromlist=[alias.name for alias in node.names])
             for alias in node.names:
                 if alias.name != "*" and not hasattr(module, alias.name):
-                    raise ImportError(f"cannot import name '{alias.name}' from '{node.module}'")
+                    return None, ImportError(f"cannot import name '{alias.name}' from '{node.module}'")
 
     undefined_checker = UndefinedNameChecker()
     undefined_checker.visit(tree)
     undefined_checker.check()
     if undefined_checker.errors:
-        raise NameError("; ".join(undefined_checker.errors))
+        return None, NameError("; ".join(undefined_checker.errors))
 
     validator = MethodCallValidator()
     validator.visit(tree)
     if validator.errors:
-        raise AttributeError("; ".join(validator.errors))
+        return None, AttributeError("; ".join(validator.errors))
+    if validator.call_errors:
+        return None, TypeError("; ".join(validator.call_errors))
+    return SdkUsage(frozenset(validator.usages), validator.covered), None
 
 
 def _testable_code(code: str) -> str:
@@ -501,7 +728,173 @@ result: Any = None
 """ + "\n" + code
 
 
-@pytest.mark.parametrize("filename,codeblock", DOC_BLOCKS)
-def test_python_examples(filename, codeblock):
+def warm_up_sdk() -> None:
+    """Load the SDK and its common types before any example is timed.
+
+    Otherwise the first example of a session pays for the SDK imports and
+    ``--record-durations`` stores that one-time cost as its own duration. A
+    missing or mismatched SDK is left for the examples to report.
+    """
+    try:
+        _check_tree(ast.parse(_testable_code("")))
+    except RuntimeError:
+        return
+    for name in ("PDFDancer", "PageClient"):
+        value = SDK_TYPES.get(name)
+        if value is not None:
+            SDK_TYPES.signatures(value)
+
+
+# Usages of blocks that passed in this session, keyed by block; conftest.py
+# turns them into the SDK usage index.
+SDK_USAGE: dict[DocBlock, SdkUsage] = {}
+
+# Usages of passing content, keyed by SDK version and canonical digest, so
+# copies of an example are validated once. Failures are not stored: every
+# failing copy is validated again and reports its own line numbers.
+VALIDATED_CONTENT: dict[tuple[str, str], SdkUsage] = {}
+
+
+def _resolve_usage(usage: str) -> object:
+    module_name, _, attribute_path = usage.partition(":")
+    value: object = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."):
+        value = inspect.getattr_static(value, attribute)
+    return value
+
+
+def _usage_fingerprint(usage: str) -> str | None:
+    """Describe an SDK member so a later run can tell whether it changed."""
+    try:
+        value = _resolve_usage(usage)
+    except (ImportError, AttributeError):
+        return None
+    if isinstance(value, property):
+        value = value.fget
+    elif isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+    try:
+        return str(inspect.signature(value))
+    except (TypeError, ValueError):
+        return type(value).__qualname__
+
+
+def build_usage_index(
+    usage_by_block: dict[DocBlock, SdkUsage],
+    blocks: list[DocBlock],
+    previous: dict[str, Any] | None = None,
+    failed: list[DocBlock] | None = None,
+) -> dict[str, Any]:
+    """Invert block usages into an SDK member -> documentation block index.
+
+    Blocks that did not run in this session keep their entries from
+    ``previous`` if they still exist, so a selective run updates the index
+    instead of truncating it. Blocks in ``failed`` ran and failed; they are
+    left out and therefore count as unseen next time. ``uncoveredBlocks``
+    lists the blocks whose usages do not describe everything they depend on.
+    """
+    failed_digests = {block.digest for block in failed or ()}
+    current = {block.digest: block for block in blocks if block.digest not in failed_digests}
+    usages_by_digest: dict[str, set[str]] = {}
+    block_ids: dict[str, str] = {}
+    uncovered: set[str] = set()
+    if previous:
+        for digest in previous["blocks"]:
+            if digest in current:
+                usages_by_digest[digest] = set()
+                block_ids[digest] = current[digest].id
+        # Indexes written before coverage was tracked cover nothing.
+        uncovered.update(
+            digest for digest in previous.get("uncoveredBlocks", previous["blocks"]) if digest in block_ids
+        )
+        for usage, entry in previous["symbols"].items():
+            for digest in entry["blocks"]:
+                if digest in usages_by_digest:
+                    usages_by_digest[digest].add(usage)
+    for block, usage in usage_by_block.items():
+        if block.digest in failed_digests:
+            continue
+        usages_by_digest[block.digest] = set(usage.symbols)
+        block_ids[block.digest] = block.id
+        if usage.covered:
+            uncovered.discard(block.digest)
+        else:
+            uncovered.add(block.digest)
+
+    symbols: dict[str, dict[str, Any]] = {}
+    for digest, usages in usages_by_digest.items():
+        for usage in usages:
+            entry = symbols.setdefault(usage, {"signature": _usage_fingerprint(usage), "blocks": []})
+            entry["blocks"].append(digest)
+    for entry in symbols.values():
+        entry["blocks"].sort()
+    return {
+        "sdkVersion": EXPECTED_SDK_VERSION,
+        "blocks": dict(sorted(block_ids.items())),
+        "symbols": dict(sorted(symbols.items())),
+        "uncoveredBlocks": sorted(uncovered),
+    }
+
+
+def _diff_member_name(signature: str) -> str | None:
+    match = re.match(r"[A-Za-z_]\w*", signature)
+    return match.group(0) if match else None
+
+
+def changed_symbols_from_diff(diff: dict[str, Any]) -> set[str]:
+    """Python class and member names touched by a v3-interface-diff.json."""
+    changed: set[str] = set()
+    for change in diff.get("languages", {}).get("python", {}).get("symbolChanges", []):
+        symbol = change["id"].rsplit("#", 1)[-1]
+        member_changes = change.get("memberChanges")
+        if change["status"] != "changed" or not member_changes:
+            changed.add(symbol)
+            continue
+        for member_change in member_changes:
+            name = _diff_member_name(member_change.get("before") or member_change.get("after") or "")
+            changed.add(f"{symbol}.{name}" if name else symbol)
+    return changed
+
+
+def affected_blocks(
+    blocks: list[DocBlock],
+    index: dict[str, Any],
+    changed_symbols: set[str] | None = None,
+) -> list[DocBlock]:
+    """Select the blocks whose SDK usages changed, plus blocks the index has not seen.
+
+    A usage is affected when its fingerprint differs under the installed SDK,
+    or when its class or ``Class.member`` appears in ``changed_symbols``. When
+    the index was written for another SDK version, blocks whose usages do not
+    cover all their dependencies are selected as well.
+    """
+    changed_symbols = changed_symbols or set()
+    affected_digests: set[str] = set()
+    if index.get("sdkVersion") != EXPECTED_SDK_VERSION:
+        affected_digests.update(index.get("uncoveredBlocks", index["blocks"]))
+    for usage, entry in index["symbols"].items():
+        _, _, attribute_path = usage.partition(":")
+        owner_path, _, member = attribute_path.rpartition(".")
+        if owner_path:
+            owner = owner_path.rsplit(".", 1)[-1]
+            names = {owner, f"{owner}.{member}"}
+        else:
+            # A class or function used by name, such as an imported request type.
+            names = {member}
+        if not names.isdisjoint(changed_symbols) or _usage_fingerprint(usage) != entry["signature"]:
+            affected_digests.update(entry["blocks"])
+    return [
+        block
+        for block in blocks
+        if block.digest not in index["blocks"] or block.digest in affected_digests
+    ]
+
+
+@pytest.mark.parametrize("block", DOC_BLOCKS, ids=lambda block: block.id)
+def test_python_examples(block):
     """Test each Python code block from the selected documentation pages."""
-    validate_python_syntax(_testable_code(codeblock), filename)
+    code = block.code
+    key = (EXPECTED_SDK_VERSION, canonical_digest("python", code))
+    if key not in VALIDATED_CONTENT:
+        VALIDATED_CONTENT[key] = validate_python_syntax(_testable_code(code), block.filename)
+    SDK_USAGE[block] = VALIDATED_CONTENT[key]
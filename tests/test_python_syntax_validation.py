@@ -1,7 +1,10 @@
 """Test that Python doc tests properly validate syntax."""
 
+import ast
+import sys
+
 import pytest
-from test_python_docs import _testable_code, validate_python_syntax
+from test_python_docs import SdkTypeRegistry, _testable_code, validate_python_syntax
 
 
 class TestPythonSyntaxValidation:
@@ -44,3 +47,70 @@ class TestPythonSyntaxValidation:
     def test_accepts_valid_pdfdancer_method(self):
         """SDK receiver types should accept the documented page method."""
         validate_python_syntax(_testable_code("pdf.page(2)"))
+
+    def test_failure_does_not_keep_the_syntax_tree(self):
+        """Frames in a failure's traceback hold no syntax tree or visitor state."""
+        with pytest.raises(AttributeError) as excinfo:
+            validate_python_syntax(_testable_code("pdf.getPage(2)"))
+        frames = [entry.frame.f_locals for entry in excinfo.traceback]
+        assert not any(isinstance(value, ast.AST) for local_names in frames for value in local_names.values())
+
+    def test_catches_unknown_keyword_argument(self):
+        """SDK method calls should reject keywords the method does not accept."""
+        with pytest.raises(TypeError, match="unexpected keyword argument 'number'"):
+            validate_python_syntax(_testable_code("pdf.page(number=2)"))
+
+    def test_catches_too_many_positional_arguments(self):
+        """SDK method calls should reject extra positional arguments."""
+        with pytest.raises(TypeError, match="positional arguments but 2 were given"):
+            validate_python_syntax(_testable_code("pdf.page(2, 3)"))
+
+    def test_catches_missing_required_argument(self):
+        """SDK method calls should supply every required parameter."""
+        with pytest.raises(TypeError, match="missing required arguments: page_number"):
+            validate_python_syntax(_testable_code("pdf.page()"))
+
+    def test_catches_unknown_constructor_keyword(self):
+        """SDK constructors are bound like methods."""
+        code = 'from pdfdancer import TextReplaceRequest\nreq = TextReplaceRequest("a", "b", bogus=1)\n'
+        with pytest.raises(TypeError, match=r"'TextReplaceRequest\(\)' got an unexpected keyword argument 'bogus'"):
+            validate_python_syntax(_testable_code(code))
+
+    def test_accepts_valid_constructor_call(self):
+        """Constructors accept their documented arguments, including through the module."""
+        validate_python_syntax(_testable_code("import pdfdancer\ncolor = pdfdancer.Color(255, 0, 0, a=128)\n"))
+
+    def test_accepts_argument_unpacking(self):
+        """Calls that unpack arguments cannot be bound statically and are accepted."""
+        validate_python_syntax(_testable_code("arguments = [2]\npdf.page(*arguments)"))
+
+
+class TestSdkTypeRegistry:
+    """Verify that SDK classes are resolved lazily and in registration order."""
+
+    def test_imports_a_source_only_when_a_lookup_reaches_it(self, tmp_path, monkeypatch):
+        """A module is not imported until a name that only it provides is looked up."""
+        (tmp_path / "lazy_sdk_types.py").write_text("class Shape:\n    def area(self): pass\n")
+        monkeypatch.syspath_prepend(tmp_path)
+        registry = SdkTypeRegistry([
+            ("collections", ("OrderedDict",), True),
+            ("lazy_sdk_types", ("Shape",), False),
+        ])
+        assert registry.get("OrderedDict").__name__ == "OrderedDict"
+        assert "lazy_sdk_types" not in sys.modules
+        shape = registry.get("Shape")
+        assert "lazy_sdk_types" in sys.modules
+        assert "area" in registry.members(shape)
+        assert registry.is_sdk_class(shape)
+
+    def test_later_sources_shadow_earlier_ones(self):
+        """The last source that provides a class name wins, as in registration order."""
+        registry = SdkTypeRegistry([("collections", ("OrderedDict",), True), ("json", None, True)])
+        assert registry.get("JSONDecoder").__module__.startswith("json")
+        assert registry.get("missing_name", "fallback") == "fallback"
+
+    def test_missing_required_class_is_reported(self):
+        """A required class that the installed SDK lacks fails with the SDK load error."""
+        registry = SdkTypeRegistry([("collections", ("NoSuchClass",), True)])
+        with pytest.raises(RuntimeError, match="Could not load the documented SDK API"):
+            registry.get("NoSuchClass")
@@ -0,0 +1,82 @@
+"""Test the SDK usage index used for selective documentation revalidation."""
+
+from test_python_docs import (
+    DocBlock,
+    _testable_code,
+    affected_blocks,
+    build_usage_index,
+    changed_symbols_from_diff,
+    validate_python_syntax,
+)
+
+
+PAGE_BLOCK = DocBlock("docs/example.md", 3, "pdf.page(1)\n")
+OPEN_BLOCK = DocBlock("docs/example.md", 9, "pdf = PDFDancer.open('input.pdf')\n")
+
+
+def _index(*blocks):
+    usages = {block: validate_python_syntax(_testable_code(block.code)) for block in blocks}
+    return build_usage_index(usages, list(blocks))
+
+
+class TestSdkUsageIndex:
+    """Verify which blocks are selected for revalidation."""
+
+    def test_records_resolved_sdk_members(self):
+        """Calls are indexed by the declaring module and class of the receiver."""
+        index = _index(PAGE_BLOCK)
+        assert any(usage.endswith(":PDFDancer.page") for usage in index["symbols"])
+        assert index["blocks"] == {PAGE_BLOCK.digest: PAGE_BLOCK.id}
+
+    def test_unchanged_sdk_selects_only_new_blocks(self):
+        """Indexed blocks are skipped while the SDK members they use are unchanged."""
+        new_block = DocBlock("docs/example.md", 20, "pdf.page(2)\n")
+        index = _index(PAGE_BLOCK, OPEN_BLOCK)
+        assert affected_blocks([PAGE_BLOCK, OPEN_BLOCK, new_block], index) == [new_block]
+
+    def test_changed_fingerprint_selects_using_blocks(self):
+        """A member whose signature changed selects every block that calls it."""
+        index = _index(PAGE_BLOCK, OPEN_BLOCK)
+        usage = next(usage for usage in index["symbols"] if usage.endswith(":PDFDancer.page"))
+        index["symbols"][usage]["signature"] = "(self)"
+        assert affected_blocks([PAGE_BLOCK, OPEN_BLOCK], index) == [PAGE_BLOCK]
+
+    def test_interface_diff_selects_changed_members(self):
+        """Member changes from v3-interface-diff.json select the blocks that call them."""
+        diff = {"languages": {"python": {"symbolChanges": [{
+            "id": "PDFDancer",
+            "status": "changed",
+            "kind": "class",
+            "memberChanges": [{"kind": "changed", "symbol": "PDFDancer", "before": "open(cls)", "after": "open(cls, x)"}],
+        }]}}}
+        changed = changed_symbols_from_diff(diff)
+        assert changed == {"PDFDancer.open"}
+        index = _index(PAGE_BLOCK, OPEN_BLOCK)
+        assert affected_blocks([PAGE_BLOCK, OPEN_BLOCK], index, changed) == [OPEN_BLOCK]
+
+    def test_imported_and_constructed_names_are_indexed(self):
+        """A block that only imports and constructs an SDK class is selected when that class changes."""
+        request_block = DocBlock("docs/example.md", 30, "from pdfdancer import Color\ncolor = Color(255, 0, 0)\n")
+        index = _index(PAGE_BLOCK, request_block)
+        assert "pdfdancer:Color" in index["symbols"]
+        assert affected_blocks([PAGE_BLOCK, request_block], index, {"Color"}) == [request_block]
+
+    def test_new_sdk_version_selects_uncovered_blocks(self):
+        """After a pin change, blocks with dependencies the fingerprints miss are revalidated."""
+        property_block = DocBlock("docs/example.md", 40, "print(request.pages)\n")
+        index = _index(PAGE_BLOCK, property_block)
+        assert index["uncoveredBlocks"] == [property_block.digest]
+        assert affected_blocks([PAGE_BLOCK, property_block], index) == []
+        index["sdkVersion"] = "0.0.1"
+        assert affected_blocks([PAGE_BLOCK, property_block], index) == [property_block]
+
+    def test_failed_block_is_selected_again(self):
+        """A block that fails after a pin change stays affected until it passes."""
+        index = _index(PAGE_BLOCK, OPEN_BLOCK)
+        index["sdkVersion"] = "0.0.1"
+        usage = next(usage for usage in index["symbols"] if usage.endswith(":PDFDancer.page"))
+        index["symbols"][usage]["signature"] = "(self)"
+        assert affected_blocks([PAGE_BLOCK, OPEN_BLOCK], index) == [PAGE_BLOCK]
+        index = build_usage_index({}, [PAGE_BLOCK, OPEN_BLOCK], index, [PAGE_BLOCK])
+        assert PAGE_BLOCK.digest not in index["blocks"]
+        assert affected_blocks([PAGE_BLOCK, OPEN_BLOCK], index) == [PAGE_BLOCK]